@@ -54,6 +54,7 @@ Utility Options:
   --setup-only          Run only the modem setup commands and exit
   --smart-config        Use smart configuration system (only changes settings that differ from desired values)
   --config-file FILE    Path to YAML configuration file for smart configuration (default: modem_config.yaml)
+  --force-config        Check the GNSS settings even if the GNSS configuration was already applied
   --signal-monitor      Monitor signal strength in real-time (simplified mode)
   --oneshot             Run smart config, then each command cycle once, then exit
   
@@ -328,13 +329,14 @@ def run_command_set(modem: ModemCommunicator, parser: ModemResponseParser,
     return success_count, total_commands
 
 
-def oneshot_mode(config: Dict[str, Any], config_file: str) -> int:
+def oneshot_mode(config: Dict[str, Any], config_file: str, force_config: bool = False) -> int:
     """
     Run smart configuration, then each command cycle once, then exit.
 
     Args:
         config: Configuration dictionary.
         config_file: Path to the smart configuration YAML file.
+        force_config: Check the GNSS settings even if they were already applied.
 
     Returns:
         int: Exit code (0 for success, 1 for failure).
@@ -368,7 +370,7 @@ def oneshot_mode(config: Dict[str, Any], config_file: str) -> int:
             logger.log_warning("Modem initialization failed. Continuing, but some commands might behave unexpectedly.")
 
         logger.log_info("Applying smart configuration...")
-        smart_config_success = apply_smart_configuration(modem, config_file, logger)
+        smart_config_success = apply_smart_configuration(modem, config_file, logger, force=force_config)
         if smart_config_success:
             logger.log_info("Smart configuration applied successfully.")
         else:
@@ -404,6 +406,8 @@ def oneshot_mode(config: Dict[str, Any], config_file: str) -> int:
     finally:
         if modem and modem.connected:
             modem.disconnect()
+        if parser:
+            parser.close()
         if logger:
             logger.close()
 
@@ -476,6 +480,7 @@ def show_detailed_modem_info(config: Dict[str, Any]) -> int:
     )
     
     modem = ModemCommunicator(config=config, logger=logger)
+    parser = None
     
     try:
         if not modem.connect():
@@ -506,6 +511,8 @@ def show_detailed_modem_info(config: Dict[str, Any]) -> int:
     finally:
         if modem and modem.connected:
             modem.disconnect()
+        if parser is not None:
+            parser.close()
         if logger:
             logger.close()
 
@@ -552,13 +559,14 @@ def setup_modem_only(config: Dict[str, Any]) -> int:
             logger.close()
 
 
-def smart_config_only(config: Dict[str, Any], config_file: str) -> int:
+def smart_config_only(config: Dict[str, Any], config_file: str, force_config: bool = False) -> int:
     """
     Run only the smart configuration system.
     
     Args:
         config: Configuration dictionary
         config_file: Path to the YAML configuration file
+        force_config: Check the GNSS settings even if they were already applied
         
     Returns:
         int: Exit code (0 for success, 1 for failure)
@@ -579,7 +587,7 @@ def smart_config_only(config: Dict[str, Any], config_file: str) -> int:
             logger.log_warning("Modem initialization failed, continuing anyway")
             
         # Apply smart configuration
-        success = apply_smart_configuration(modem, config_file, logger)
+        success = apply_smart_configuration(modem, config_file, logger, force=force_config)
         
         if success:
             logger.log_info("Smart configuration completed successfully")
@@ -794,7 +802,7 @@ def run_main_loop(config: Dict[str, Any], args) -> int:
                 logger.log_warning("Modem initialization failed, continuing anyway.")
             
             logger.log_info("Applying smart configuration...")
-            if not apply_smart_configuration(modem, args.config_file, logger):
+            if not apply_smart_configuration(modem, args.config_file, logger, force=args.force_config):
                 logger.log_warning("Smart configuration failed. Continuing with main loop.")
         else:
             if not modem_setup(modem, logger):
@@ -849,6 +857,8 @@ def run_main_loop(config: Dict[str, Any], args) -> int:
     finally:
         if modem and modem.connected:
             modem.disconnect()
+        if parser:
+            parser.close()
         if logger:
             logger.close()
 
@@ -983,6 +993,8 @@ Examples:
                       help="Use smart configuration system (only changes settings that differ from desired values)")
     util_group.add_argument("--config-file", type=str, default="modem_config.yaml",
                       help="Path to YAML configuration file for smart configuration")
+    util_group.add_argument("--force-config", action="store_true", default=False,
+                      help="Check the GNSS settings even if the GNSS configuration was already applied")
     util_group.add_argument("--signal-monitor", action="store_true", default=False,
                       help="Monitor signal strength in real-time (simplified mode)")
     util_group.add_argument("--oneshot", action="store_true", default=False,
@@ -1055,7 +1067,7 @@ def main():
         
     # If --smart-config is specified, run only the smart configuration system and exit
     if args.smart_config:
-        return smart_config_only(config, args.config_file)
+        return smart_config_only(config, args.config_file, args.force_config)
         
     # If --signal-monitor is specified, monitor signal strength in real-time and exit
     if args.signal_monitor:
@@ -1063,7 +1075,7 @@ def main():
     
     # If --oneshot is specified, run smart config, then each command cycle once, then exit
     if args.oneshot:
-        return oneshot_mode(config, args.config_file)
+        return oneshot_mode(config, args.config_file, args.force_config)
 
     # Default behavior: Run the main Cell War Driver loop
     return run_main_loop(config, args)
@@ -95,14 +95,16 @@ class ModemCommunicator:
         if wait_time is None:
             wait_time = self.command_delay
         time.sleep(float(wait_time if wait_time is not None else 0.1))  # Provide a default if wait_time is None
-          # Read response
-        response = ""
+        # Read response as raw bytes and decode once at the end. Decoding each
+        # chunk separately costs a decode and a string copy per read, and can
+        # split a multi-byte character across two reads.
+        raw_response = bytearray()
         while self.serial.in_waiting:
-            chunk = self.serial.read(self.serial.in_waiting).decode('utf-8', errors='replace')
-            response += chunk
+            raw_response += self.serial.read(self.serial.in_waiting)
             # Small delay to allow for more data to arrive
             time.sleep(0.1)
-        
+        response = raw_response.decode('utf-8', errors='replace')
+
         self.logger.log_response(response.strip())
         return response
     
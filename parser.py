@@ -3,106 +3,235 @@ Parser module for the Cell War Driver program.
 
 This module handles parsing of AT command responses into structured data.
 """
+import io
 import os
+import re
 import csv
+import atexit
 import json
+import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Any, Tuple
 
+from logger import ModemLogger
 
-def _parse_network_registration(command: str, lines: List[str], result: Dict[str, Any]) -> None:
+# orjson serializes considerably faster than the stdlib json module; use it
+# when available, but don't require it
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+def _strip_quotes(value: str) -> str:
+    """Strip surrounding spaces, tabs and double quotes from a response field."""
+    # One strip call with the combined character set; fields come from
+    # already-stripped lines, so they can't contain line breaks
+    return value.strip(' \t"')
+
+
+def _int_any_base(value: str) -> int:
+    """
+    Convert an integer field written with or without a 0x/0o/0b prefix.
+    
+    Args:
+        value: Field text, e.g. "0x1A2B" or "6699"
+        
+    Returns:
+        int: The converted value
+        
+    Raises:
+        ValueError: If the field isn't an integer
+    """
+    try:
+        return int(value, 0)
+    except ValueError:
+        # Base 0 rejects zero-padded decimals such as "0012"
+        return int(value)
+
+
+# Identity queries whose response is a single bare value, and the result key
+# the value is stored under
+_SIMPLE_INFO_KEYS = {
+    "AT+CGMI": "cgmi",  # Manufacturer
+    "AT+CGMM": "cgmm",  # Model
+    "AT+CGMR": "cgmr",  # Firmware version
+    "AT+CGSN": "cgsn",  # Serial number
+    "AT+CIMI": "cimi",  # IMSI
+}
+
+# Quectel system modes that report LTE-style measurements
+_LTE_SYSTEM_MODES = frozenset({"LTE", "CAT-M", "NB-IoT"})
+
+# Names for the numeric codes in 3GPP TS 27.007 responses
+
+# <stat> of +CREG/+CGREG/+CEREG
+_REG_STATUS_NAMES = {
+    0: "Not registered, not searching",
+    1: "Registered, home network",
+    2: "Not registered, searching",
+    3: "Registration denied",
+    4: "Unknown",
+    5: "Registered, roaming",
+}
+
+# <AcT> of +CREG/+CGREG/+CEREG and +COPS
+_ACT_NAMES = {
+    0: "GSM",
+    1: "GSM Compact",
+    2: "UTRAN",
+    3: "GSM w/EGPRS",
+    4: "UTRAN w/HSDPA",
+    5: "UTRAN w/HSUPA",
+    6: "UTRAN w/HSDPA and HSUPA",
+    7: "E-UTRAN",
+    8: "EC-GSM-IoT",
+    9: "E-UTRAN (NB-S1 mode)",
+    10: "E-UTRA connected to a 5GCN",
+    11: "NR connected to a 5GCN",
+    12: "NG-RAN",
+    13: "E-UTRA-NR dual connectivity",
+}
+
+# <mode> of +COPS
+_OPER_MODE_NAMES = {
+    0: "Automatic",
+    1: "Manual",
+    2: "Manual deregister",
+    3: "Set only format",
+    4: "Manual/Automatic",
+}
+
+# <format> of +COPS
+_OPER_FORMAT_NAMES = {
+    0: "Long alphanumeric",
+    1: "Short alphanumeric",
+    2: "Numeric",
+}
+
+# <fun> of +CFUN
+_CFUN_NAMES = {
+    0: "Minimum",
+    1: "Full",
+    2: "Disabled",
+    3: "Disabled phone Tx and Rx",
+    4: "Disabled phone Tx and Rx, standalone GPS",
+    5: "Factory Test",
+    6: "Offline",
+    7: "Offline factory test",
+}
+
+# <sel> of +CPLS
+_PLMN_SELECTOR_NAMES = {
+    "0": "User controlled PLMN selector with access technology",
+    "1": "Operator controlled PLMN selector with access technology",
+    "2": "HPLMN selector with access technology",
+}
+
+# Field layouts for responses that are a plain comma-separated value list after
+# the response prefix. Each entry maps a command to
+# (minimum value count, [(result key, value index, required value count, converter), ...])
+# so one generic routine can parse all of them instead of a hand-written branch each.
+# A field is only set when the line has at least its required value count, which
+# keeps fields that belong together (like the SPN MCC/MNC pair) from being split.
+_RESPONSE_SCHEMAS: Dict[str, Tuple[int, List[Tuple[str, int, int, Callable[[str], Any]]]]] = {
+    "AT+COPS?": (3, [
+        ("operator_mode", 0, 1, str.strip),
+        ("operator_format", 1, 2, str.strip),
+        ("operator_name", 2, 3, _strip_quotes),
+        ("act", 3, 4, str.strip),
+    ]),
+    "AT+QSPN": (1, [
+        ("operator_full", 0, 1, _strip_quotes),
+        ("operator_short", 1, 2, _strip_quotes),
+        ("spn_mcc", 2, 4, _strip_quotes),
+        ("spn_mnc", 3, 4, _strip_quotes),
+    ]),
+}
+
+
+def _apply_schema(min_fields: int, fields: List[Tuple[str, int, int, Callable[[str], Any]]],
+                  lines: List[str], result: Dict[str, Any]) -> None:
+    """
+    Parse a comma-separated response according to a field schema.
+    
+    The schema comes first so a schema-bound partial can serve as a handler.
+    
+    Args:
+        min_fields: Minimum number of values a line must have to be parsed
+        fields: (result key, value index, required value count, converter)
+            tuples; fields whose required count the line doesn't reach are skipped
+        lines: Response lines from the modem, already limited to the
+            command's response prefix
+        result: Dictionary to update with parsed values
+    """
+    for line in lines:
+        values = line.partition(":")[2].strip().split(",")
+        if len(values) < min_fields:
+            continue
+        for key, index, required, convert in fields:
+            if len(values) >= required:
+                result[key] = convert(values[index])
+
+
+def _parse_network_registration(technology: str, lines: List[str], result: Dict[str, Any]) -> None:
     """
     Parse network registration information.
     
     Args:
-        command: The AT command that was sent
+        technology: Radio technology the registration query covers
+            ("GSM" for AT+CREG, "UMTS" for AT+CGREG, "LTE" for AT+CEREG)
         lines: Response lines from the modem
         result: Dictionary to update with parsed values
     """
-    # Different commands for different technologies
-    if command.startswith("AT+CREG?"):  # GSM
-        result["technology"] = "GSM"
-        reg_prefix = "+CREG:"
-    elif command.startswith("AT+CGREG?"):  # GPRS/EDGE/UMTS
-        result["technology"] = "UMTS"
-        reg_prefix = "+CGREG:"
-    elif command.startswith("AT+CEREG?"):  # LTE/5G
-        result["technology"] = "LTE"
-        reg_prefix = "+CEREG:"
-    else:
-        return
+    result["technology"] = technology
     
     # Parse registration information
     for line in lines:
-        if reg_prefix in line:
-            parts = line.split(",")
+        parts = line.split(",")
             
-            # Extract registration status
-            if len(parts) >= 2:
-                status_part = parts[1].strip()
-                status_code = int(status_part)
+        # Extract registration status
+        if len(parts) >= 2:
+            status_part = parts[1].strip()
+            status_code = int(status_part)
                 
-                if status_code == 0:
-                    result["registration_status"] = "Not registered, not searching"
-                elif status_code == 1:
-                    result["registration_status"] = "Registered, home network"
-                elif status_code == 2:
-                    result["registration_status"] = "Not registered, searching"
-                elif status_code == 3:
-                    result["registration_status"] = "Registration denied"
-                elif status_code == 4:
-                    result["registration_status"] = "Unknown"
-                elif status_code == 5:
-                    result["registration_status"] = "Registered, roaming"
-                else:
-                    result["registration_status"] = f"Unknown status ({status_code})"
+            result["registration_status"] = _REG_STATUS_NAMES.get(status_code, f"Unknown status ({status_code})")
             
-            # Extract location information if available
-            if len(parts) >= 4:  # If we have location info
-                try:
-                    # Location Area Code
-                    lac = parts[2].strip().strip('"')
-                    result["lac"] = int(lac, 16) if lac.startswith("0x") else int(lac)
+        # Extract location information if available
+        if len(parts) >= 4:  # If we have location info
+            try:
+                # Location Area Code
+                result["lac"] = _int_any_base(_strip_quotes(parts[2]))
                     
-                    # Cell ID
-                    cell_id = parts[3].strip().strip('"')
-                    result["cell_id"] = int(cell_id, 16) if cell_id.startswith("0x") else int(cell_id)
+                # Cell ID
+                result["cell_id"] = _int_any_base(_strip_quotes(parts[3]))
                     
-                    # Access technology if available
-                    if len(parts) >= 5:
-                        act = int(parts[4].strip())
-                        if act == 0:
-                            result["access_technology"] = "GSM"
-                        elif act == 1:
-                            result["access_technology"] = "GSM Compact"
-                        elif act == 2:
-                            result["access_technology"] = "UTRAN"
-                        elif act == 3:
-                            result["access_technology"] = "GSM w/EGPRS"
-                        elif act == 4:
-                            result["access_technology"] = "UTRAN w/HSDPA"
-                        elif act == 5:
-                            result["access_technology"] = "UTRAN w/HSUPA"
-                        elif act == 6:
-                            result["access_technology"] = "UTRAN w/HSDPA and HSUPA"
-                        elif act == 7:
-                            result["access_technology"] = "E-UTRAN"
-                        elif act == 8:
-                            result["access_technology"] = "EC-GSM-IoT"
-                        elif act == 9:
-                            result["access_technology"] = "E-UTRAN (NB-S1 mode)"
-                        elif act == 10:
-                            result["access_technology"] = "E-UTRA connected to a 5GCN"
-                        elif act == 11:
-                            result["access_technology"] = "NR connected to a 5GCN"
-                        elif act == 12:
-                            result["access_technology"] = "NG-RAN"
-                        elif act == 13:
-                            result["access_technology"] = "E-UTRA-NR dual connectivity"
-                        else:
-                            result["access_technology"] = f"Unknown ({act})"
-                except (ValueError, IndexError) as e:
-                    pass
+                # Access technology if available
+                if len(parts) >= 5:
+                    act = int(parts[4].strip())
+                    result["access_technology"] = _ACT_NAMES.get(act, f"Unknown ({act})")
+            except (ValueError, IndexError):
+                pass
+
+
+# Numeric field layouts of the +CSQ: <rssi>,<ber> and
+# +CESQ: <rxlev>,<ber>,<rscp>,<ecno>,<rsrq>,<rsrp> responses
+_CSQ_RE = re.compile(r"\+CSQ:\s*(\d+)\s*,\s*(\d+)")
+_CESQ_RE = re.compile(r"\+CESQ:\s*" + r"\s*,\s*".join([r"(\d+)"] * 6))
+
+# +CESQ fields in response order as
+# (result key, offset, slope, "unknown" value, whether to keep the raw value):
+# a known raw value is reported as offset + slope * raw
+_CESQ_FIELDS = (
+    ("rxlev", -111, 1, 99, True),  # RXLEV - GSM
+    ("ber_extended", 0, 1, 99, False),  # BER - GSM
+    ("rscp", -121, 1, 127, True),  # RSCP - WCDMA
+    ("ecno", -24.5, 0.5, 99, True),  # ECNO - WCDMA
+    ("rsrq", -20, 0.5, 99, True),  # RSRQ - LTE
+    ("rsrp", -141, 1, 99, True),  # RSRP - LTE
+)
 
 
 def _parse_signal_quality(lines: List[str], result: Dict[str, Any]) -> None:
@@ -114,29 +243,24 @@ def _parse_signal_quality(lines: List[str], result: Dict[str, Any]) -> None:
         result: Dictionary to update with parsed values
     """
     for line in lines:
-        if "+CSQ:" in line:
-            parts = line.split(":")
-            if len(parts) >= 2:
-                values = parts[1].strip().split(",")
-                if len(values) >= 2:
-                    try:
-                        rssi_val = int(values[0])
-                        # Convert to dBm (-113 to -51 dBm)
-                        if rssi_val < 99:  # 99 means unknown
-                            result["rssi"] = -113 + (2 * rssi_val)
-                            result["rssi_raw"] = rssi_val
-                        else:
-                            result["rssi"] = "unknown"
-                            result["rssi_raw"] = 99
-                        
-                        # Parse bit error rate
-                        ber_val = int(values[1])
-                        if ber_val < 7:  # 7 means unknown
-                            result["ber"] = ber_val
-                        else:
-                            result["ber"] = "unknown"
-                    except (ValueError, IndexError):
-                        pass
+        match = _CSQ_RE.match(line)
+        if not match:
+            continue
+        rssi_val, ber_val = map(int, match.groups())
+        
+        # Convert to dBm (-113 to -51 dBm)
+        if rssi_val < 99:  # 99 means unknown
+            result["rssi"] = -113 + (2 * rssi_val)
+            result["rssi_raw"] = rssi_val
+        else:
+            result["rssi"] = "unknown"
+            result["rssi_raw"] = 99
+            
+        # Parse bit error rate
+        if ber_val < 7:  # 7 means unknown
+            result["ber"] = ber_val
+        else:
+            result["ber"] = "unknown"
 
 
 def _parse_extended_signal_quality(lines: List[str], result: Dict[str, Any]) -> None:
@@ -148,48 +272,14 @@ def _parse_extended_signal_quality(lines: List[str], result: Dict[str, Any]) ->
         result: Dictionary to update with parsed values
     """
     for line in lines:
-        if "+CESQ:" in line:
-            parts = line.split(":")
-            if len(parts) >= 2:
-                values = parts[1].strip().split(",")
-                if len(values) >= 6:
-                    try:
-                        # RXLEV - GSM
-                        rxlev = int(values[0])
-                        if rxlev < 99:
-                            result["rxlev"] = -111 + rxlev
-                            result["rxlev_raw"] = rxlev
-                        
-                        # BER - GSM
-                        ber = int(values[1])
-                        if ber < 99:
-                            result["ber_extended"] = ber
-                        
-                        # RSCP - WCDMA
-                        rscp = int(values[2])
-                        if rscp < 127:
-                            result["rscp"] = -121 + rscp
-                            result["rscp_raw"] = rscp
-                        
-                        # ECNO - WCDMA
-                        ecno = int(values[3])
-                        if ecno < 99:
-                            result["ecno"] = -24.5 + (0.5 * ecno)
-                            result["ecno_raw"] = ecno
-                        
-                        # RSRQ - LTE
-                        rsrq = int(values[4])
-                        if rsrq < 99:
-                            result["rsrq"] = -20 + (rsrq * 0.5)
-                            result["rsrq_raw"] = rsrq
-                        
-                        # RSRP - LTE
-                        rsrp = int(values[5])
-                        if rsrp < 99:
-                            result["rsrp"] = -141 + rsrp
-                            result["rsrp_raw"] = rsrp
-                    except (ValueError, IndexError):
-                        pass
+        match = _CESQ_RE.match(line)
+        if not match:
+            continue
+        for (key, offset, slope, unknown, keep_raw), raw in zip(_CESQ_FIELDS, map(int, match.groups())):
+            if raw < unknown:
+                result[key] = offset + slope * raw
+                if keep_raw:
+                    result[f"{key}_raw"] = raw
 
 
 def _parse_gprs_attachment(lines: List[str], result: Dict[str, Any]) -> None:
@@ -201,15 +291,14 @@ def _parse_gprs_attachment(lines: List[str], result: Dict[str, Any]) -> None:
         result: Dictionary to update with parsed values
     """
     for line in lines:
-        if "+CGATT:" in line:
-            parts = line.split(":")
-            if len(parts) >= 2:
-                try:
-                    status = int(parts[1].strip())
-                    result["gprs_attached"] = status == 1
-                    result["gprs_status"] = "Attached" if status == 1 else "Detached"
-                except (ValueError, IndexError):
-                    pass
+        _, separator, tail = line.partition(":")
+        if separator:
+            try:
+                status = int(tail.strip())
+                result["gprs_attached"] = status == 1
+                result["gprs_status"] = "Attached" if status == 1 else "Detached"
+            except (ValueError, IndexError):
+                pass
 
 
 def _parse_current_operator(lines: List[str], result: Dict[str, Any]) -> None:
@@ -221,76 +310,28 @@ def _parse_current_operator(lines: List[str], result: Dict[str, Any]) -> None:
         result: Dictionary to update with parsed values
     """
     for line in lines:
-        if "+COPS:" in line:
-            parts = line.split(":")
-            if len(parts) >= 2:
-                values = parts[1].strip().split(",")
-                if len(values) >= 3:
-                    try:
-                        # Mode
-                        mode = int(values[0])
-                        if mode == 0:
-                            result["operator_selection_mode"] = "Automatic"
-                        elif mode == 1:
-                            result["operator_selection_mode"] = "Manual"
-                        elif mode == 2:
-                            result["operator_selection_mode"] = "Manual deregister"
-                        elif mode == 3:
-                            result["operator_selection_mode"] = "Set only format"
-                        elif mode == 4:
-                            result["operator_selection_mode"] = "Manual/Automatic"
-                        else:
-                            result["operator_selection_mode"] = f"Unknown ({mode})"
+        _, separator, tail = line.partition(":")
+        if separator:
+            values = tail.strip().split(",")
+            if len(values) >= 3:
+                try:
+                    # Mode
+                    mode = int(values[0])
+                    result["operator_selection_mode"] = _OPER_MODE_NAMES.get(mode, f"Unknown ({mode})")
                         
-                        # Format
-                        format_type = int(values[1])
-                        if format_type == 0:
-                            result["operator_format"] = "Long alphanumeric"
-                        elif format_type == 1:
-                            result["operator_format"] = "Short alphanumeric"
-                        elif format_type == 2:
-                            result["operator_format"] = "Numeric"
-                        else:
-                            result["operator_format"] = f"Unknown ({format_type})"
+                    # Format
+                    format_type = int(values[1])
+                    result["operator_format"] = _OPER_FORMAT_NAMES.get(format_type, f"Unknown ({format_type})")
                         
-                        # Operator name/code
-                        result["operator"] = values[2].strip('"')
+                    # Operator name/code
+                    result["operator"] = _strip_quotes(values[2])
                         
-                        # Access technology
-                        if len(values) >= 4:
-                            act = int(values[3])
-                            if act == 0:
-                                result["act"] = "GSM"
-                            elif act == 1:
-                                result["act"] = "GSM Compact"
-                            elif act == 2:
-                                result["act"] = "UTRAN"
-                            elif act == 3:
-                                result["act"] = "GSM w/EGPRS"
-                            elif act == 4:
-                                result["act"] = "UTRAN w/HSDPA"
-                            elif act == 5:
-                                result["act"] = "UTRAN w/HSUPA"
-                            elif act == 6:
-                                result["act"] = "UTRAN w/HSDPA and HSUPA"
-                            elif act == 7:
-                                result["act"] = "E-UTRAN"
-                            elif act == 8:
-                                result["act"] = "EC-GSM-IoT"
-                            elif act == 9:
-                                result["act"] = "E-UTRAN (NB-S1 mode)"
-                            elif act == 10:
-                                result["act"] = "E-UTRA connected to a 5GCN"
-                            elif act == 11:
-                                result["act"] = "NR connected to a 5GCN"
-                            elif act == 12:
-                                result["act"] = "NG-RAN"
-                            elif act == 13:
-                                result["act"] = "E-UTRA-NR dual connectivity"
-                            else:
-                                result["act"] = f"Unknown ({act})"
-                    except (ValueError, IndexError):
-                        pass
+                    # Access technology
+                    if len(values) >= 4:
+                        act = int(values[3])
+                        result["act"] = _ACT_NAMES.get(act, f"Unknown ({act})")
+                except (ValueError, IndexError):
+                    pass
 
 
 def _parse_functionality_status(lines: List[str], result: Dict[str, Any]) -> None:
@@ -302,31 +343,13 @@ def _parse_functionality_status(lines: List[str], result: Dict[str, Any]) -> Non
         result: Dictionary to update with parsed values
     """
     for line in lines:
-        if "+CFUN:" in line:
-            parts = line.split(":")
-            if len(parts) >= 2:
-                try:
-                    fun = int(parts[1].strip())
-                    if fun == 0:
-                        result["functionality"] = "Minimum"
-                    elif fun == 1:
-                        result["functionality"] = "Full"
-                    elif fun == 2:
-                        result["functionality"] = "Disabled"
-                    elif fun == 3:
-                        result["functionality"] = "Disabled phone Tx and Rx"
-                    elif fun == 4:
-                        result["functionality"] = "Disabled phone Tx and Rx, standalone GPS"
-                    elif fun == 5:
-                        result["functionality"] = "Factory Test"
-                    elif fun == 6:
-                        result["functionality"] = "Offline"
-                    elif fun == 7:
-                        result["functionality"] = "Offline factory test"
-                    else:
-                        result["functionality"] = f"Unknown ({fun})"
-                except (ValueError, IndexError):
-                    pass
+        _, separator, tail = line.partition(":")
+        if separator:
+            try:
+                fun = int(tail.strip())
+                result["functionality"] = _CFUN_NAMES.get(fun, f"Unknown ({fun})")
+            except (ValueError, IndexError):
+                pass
 
 
 def _parse_real_time_clock(lines: List[str], result: Dict[str, Any]) -> None:
@@ -338,18 +361,18 @@ def _parse_real_time_clock(lines: List[str], result: Dict[str, Any]) -> None:
         result: Dictionary to update with parsed values
     """
     for line in lines:
-        if "+CCLK:" in line:
-            parts = line.split(":")
-            if len(parts) >= 2:
-                time_str = parts[1].strip().strip('"')
-                try:
-                    # Format is typically "YY/MM/DD,HH:MM:SS±TZ"
-                    result["modem_time"] = time_str
+        # Split at the first colon only; the time itself contains colons
+        _, separator, tail = line.partition(":")
+        if separator:
+            time_str = _strip_quotes(tail)
+            try:
+                # Format is typically "YY/MM/DD,HH:MM:SS±TZ"
+                result["modem_time"] = time_str
                     
-                    # Could parse into datetime object if needed
-                    # However, the format can vary by modem
-                except (ValueError, IndexError):
-                    pass
+                # Could parse into datetime object if needed
+                # However, the format can vary by modem
+            except (ValueError, IndexError):
+                pass
 
 def _parse_quectel_signal_quality(lines: List[str], result: Dict[str, Any]) -> None:
     """
@@ -360,77 +383,76 @@ def _parse_quectel_signal_quality(lines: List[str], result: Dict[str, Any]) -> N
         result: Dictionary to update with parsed values
     """
     for line in lines:
-        if "+QCSQ:" in line:
-            parts = line.split(":", 1)
-            if len(parts) < 2:
-                continue
+        _, separator, tail = line.partition(":")
+        if not separator:
+            continue
                 
-            values = parts[1].strip().split(",")
-            if not values:
-                continue
+        values = tail.strip().split(",")
+        if not values:
+            continue
             
-            # Initialize sysmode to avoid unbound variable error
-            sysmode = ""
+        # Initialize sysmode to avoid unbound variable error
+        sysmode = ""
                 
-            try:
-                if len(values) >= 1:
-                    sysmode = values[0].strip('"')
-                    result["qcsq_sysmode"] = sysmode
+        try:
+            if len(values) >= 1:
+                sysmode = values[0].strip('"')
+                result["qcsq_sysmode"] = sysmode
                 
-                # Parse values based on system mode
-                if sysmode == "GSM":
-                    if len(values) >= 2:
-                        rssi = values[1].strip()
-                        if rssi and rssi != "":
-                            result["rssi"] = int(rssi)
+            # Parse values based on system mode
+            if sysmode == "GSM":
+                if len(values) >= 2:
+                    rssi = values[1].strip()
+                    if rssi and rssi != "":
+                        result["rssi"] = int(rssi)
                 
-                elif sysmode == "WCDMA":
-                    if len(values) >= 2:
-                        rssi = values[1].strip()
-                        if rssi and rssi != "":
-                            result["rssi"] = int(rssi)
-                    if len(values) >= 3:
-                        rscp = values[2].strip()
-                        if rscp and rscp != "":
-                            result["rscp"] = int(rscp)
-                    if len(values) >= 4:
-                        ecno = values[3].strip()
-                        if ecno and ecno != "":
-                            result["ecno"] = int(ecno)
+            elif sysmode == "WCDMA":
+                if len(values) >= 2:
+                    rssi = values[1].strip()
+                    if rssi and rssi != "":
+                        result["rssi"] = int(rssi)
+                if len(values) >= 3:
+                    rscp = values[2].strip()
+                    if rscp and rscp != "":
+                        result["rscp"] = int(rscp)
+                if len(values) >= 4:
+                    ecno = values[3].strip()
+                    if ecno and ecno != "":
+                        result["ecno"] = int(ecno)
                 
-                elif sysmode == "LTE" or sysmode == "CAT-M" or sysmode == "NB-IoT":
-                    if len(values) >= 2:
-                        rssi = values[1].strip()
-                        if rssi and rssi != "":
-                            result["rssi"] = int(rssi)
-                    if len(values) >= 3:
-                        rsrp = values[2].strip()
-                        if rsrp and rsrp != "":
-                            result["rsrp"] = int(rsrp)
-                    if len(values) >= 4:
-                        rsrq = values[3].strip()
-                        if rsrq and rsrq != "":
-                            result["rsrq"] = int(rsrq)
-                    if len(values) >= 5:
-                        sinr = values[4].strip()
-                        if sinr and sinr != "":
-                            result["sinr"] = int(sinr)
+            elif sysmode in _LTE_SYSTEM_MODES:
+                if len(values) >= 2:
+                    rssi = values[1].strip()
+                    if rssi and rssi != "":
+                        result["rssi"] = int(rssi)
+                if len(values) >= 3:
+                    rsrp = values[2].strip()
+                    if rsrp and rsrp != "":
+                        result["rsrp"] = int(rsrp)
+                if len(values) >= 4:
+                    rsrq = values[3].strip()
+                    if rsrq and rsrq != "":
+                        result["rsrq"] = int(rsrq)
+                if len(values) >= 5:
+                    sinr = values[4].strip()
+                    if sinr and sinr != "":
+                        result["sinr"] = int(sinr)
                 
-                elif sysmode == "5G":
-                    if len(values) >= 2:
-                        rsrp = values[1].strip()
-                        if rsrp and rsrp != "":
-                            result["rsrp"] = int(rsrp)
-                    if len(values) >= 3:
-                        sinr = values[2].strip()
-                        if sinr and sinr != "":
-                            result["sinr"] = int(sinr)
-                    if len(values) >= 4:
-                        rsrq = values[3].strip()
-                        if rsrq and rsrq != "":
-                            result["rsrq"] = int(rsrq)
-            except (ValueError, IndexError):
-                pass
+            elif sysmode == "5G":
+                if len(values) >= 2:
+                    rsrp = values[1].strip()
+                    if rsrp and rsrp != "":
+                        result["rsrp"] = int(rsrp)
+                if len(values) >= 3:
+                    sinr = values[2].strip()
+                    if sinr and sinr != "":
+                        result["sinr"] = int(sinr)
+                if len(values) >= 4:
+                    rsrq = values[3].strip()
+                    if rsrq and rsrq != "":
+                        result["rsrq"] = int(rsrq)
+        except (ValueError, IndexError):
+            pass
 
 
 def _parse_quectel_network_info(lines: List[str], result: Dict[str, Any]) -> None:
@@ -442,40 +464,100 @@ def _parse_quectel_network_info(lines: List[str], result: Dict[str, Any]) -> Non
         result: Dictionary to update with parsed values
     """
     for line in lines:
-        if "+QNWINFO:" in line:
-            parts = line.split(":", 1)
-            if len(parts) < 2:
-                continue
+        _, separator, tail = line.partition(":")
+        if not separator:
+            continue
                 
-            values = parts[1].strip().split(",")
-            if len(values) < 4:
-                continue
+        values = tail.strip().split(",")
+        if len(values) < 4:
+            continue
                 
-            try:
-                # Access technology
-                act = values[0].strip('"')
-                if act:
-                    result["network_type"] = act
+        try:
+            # Access technology
+            act = values[0].strip('"')
+            if act:
+                result["network_type"] = act
                 
-                # Operator name
-                if len(values) >= 2:
-                    operator = values[1].strip('"')
-                    if operator:
-                        result["network_operator"] = operator
+            # Operator name
+            if len(values) >= 2:
+                operator = values[1].strip('"')
+                if operator:
+                    result["network_operator"] = operator
                 
-                # Band
-                if len(values) >= 3:
-                    band = values[2].strip('"')
-                    if band:
-                        result["band"] = band
+            # Band
+            if len(values) >= 3:
+                band = values[2].strip('"')
+                if band:
+                    result["band"] = band
                 
-                # Channel
-                if len(values) >= 4:
-                    channel = values[3].strip()
-                    if channel and channel.isdigit():
-                        result["channel"] = int(channel)
-            except (ValueError, IndexError):
-                pass
+            # Channel
+            if len(values) >= 4:
+                channel = values[3].strip()
+                if channel and channel.isdigit():
+                    result["channel"] = int(channel)
+        except (ValueError, IndexError):
+            pass
+
+
+def _unsigned_or_none(value: str) -> Optional[int]:
+    """Convert an unsigned decimal field to int, or None if it isn't one."""
+    value = value.strip()
+    return int(value) if value.isdigit() else None
+
+
+def _signed_or_none(value: str) -> Optional[int]:
+    """Convert a possibly negative decimal field to int, or None if it isn't one."""
+    value = value.strip()
+    return int(value) if value.lstrip("-").isdigit() else None
+
+
+def _unquote(value: str) -> str:
+    """Strip double quotes from a response field."""
+    return value.strip('"')
+
+
+# AT+QENG="servingcell" fields per RAT, in response order starting after the
+# "servingcell",<state>,<RAT> prefix. Each entry is (result key, converter)
+# or None for a field that isn't stored; a converter returning None means the
+# field had no usable value.
+_SERVING_CELL_LAYOUTS: Dict[str, Tuple[Optional[Tuple[str, Callable[[str], Any]]], ...]] = {
+    "GSM": (
+        ("mcc", _unquote),
+        ("mnc", _unquote),
+        None,
+        ("lac", _unsigned_or_none),
+        ("cell_id", _unsigned_or_none),
+        ("bsic", _unsigned_or_none),
+        ("arfcn", _unsigned_or_none),
+        ("rxlev", _unsigned_or_none),
+    ),
+    "WCDMA": (
+        ("mcc", _unquote),
+        ("mnc", _unquote),
+        None,
+        ("lac", _unsigned_or_none),
+        ("cell_id", _unsigned_or_none),
+        ("uarfcn", _unsigned_or_none),
+        ("psc", _unsigned_or_none),
+        ("rscp", _unsigned_or_none),
+        ("ecno", _unsigned_or_none),
+    ),
+    "LTE": (
+        ("mcc", _unquote),
+        ("mnc", _unquote),
+        None,
+        ("tac", _unsigned_or_none),
+        ("cell_id", _unsigned_or_none),
+        ("pcid", _unsigned_or_none),
+        ("earfcn", _unsigned_or_none),
+        ("band_num", str.strip),
+        ("bandwidth", _unsigned_or_none),  # MHz
+        ("rsrp", _signed_or_none),
+        ("rsrq", _signed_or_none),
+        ("rssi", _signed_or_none),
+        ("sinr", _signed_or_none),
+    ),
+}
 
 
 def _parse_quectel_serving_cell(lines: List[str], result: Dict[str, Any]) -> None:
@@ -487,12 +569,12 @@ def _parse_quectel_serving_cell(lines: List[str], result: Dict[str, Any]) -> Non
         result: Dictionary to update with parsed values
     """
     for line in lines:
-        if "+QENG:" in line and "servingcell" in line.lower():
-            parts = line.split(":", 1)
-            if len(parts) < 2:
+        if "servingcell" in line.lower():
+            _, separator, tail = line.partition(":")
+            if not separator:
                 continue
                 
-            values = parts[1].strip().split(",")
+            values = tail.strip().split(",")
             if len(values) < 3:  # At minimum we need the RAT type
                 continue
                 
@@ -502,109 +584,16 @@ def _parse_quectel_serving_cell(lines: List[str], result: Dict[str, Any]) -> Non
                     rat_type = values[1].strip('"')
                     result["rat_type"] = rat_type
                     
-                    if rat_type == "GSM":
-                        # GSM parsing
-                        if len(values) >= 4:  # MCC
-                            result["mcc"] = values[3].strip('"')
-                        if len(values) >= 5:  # MNC
-                            result["mnc"] = values[4].strip('"')
-                        if len(values) >= 7:  # LAC
-                            lac = values[6].strip()
-                            if lac.isdigit():
-                                result["lac"] = int(lac)
-                        if len(values) >= 8:  # Cell ID
-                            cell_id = values[7].strip()
-                            if cell_id.isdigit():
-                                result["cell_id"] = int(cell_id)
-                        if len(values) >= 9:  # BSIC
-                            bsic = values[8].strip()
-                            if bsic.isdigit():
-                                result["bsic"] = int(bsic)
-                        if len(values) >= 10:  # ARFCN
-                            arfcn = values[9].strip()
-                            if arfcn.isdigit():
-                                result["arfcn"] = int(arfcn)
-                        if len(values) >= 11:  # RxLev
-                            rxlev = values[10].strip()
-                            if rxlev.isdigit():
-                                result["rxlev"] = int(rxlev)
-                    
-                    elif rat_type == "WCDMA":
-                        # WCDMA parsing
-                        if len(values) >= 4:  # MCC
-                            result["mcc"] = values[3].strip('"')
-                        if len(values) >= 5:  # MNC
-                            result["mnc"] = values[4].strip('"')
-                        if len(values) >= 7:  # LAC
-                            lac = values[6].strip()
-                            if lac.isdigit():
-                                result["lac"] = int(lac)
-                        if len(values) >= 8:  # Cell ID
-                            cell_id = values[7].strip()
-                            if cell_id.isdigit():
-                                result["cell_id"] = int(cell_id)
-                        if len(values) >= 9:  # UARFCN
-                            uarfcn = values[8].strip()
-                            if uarfcn.isdigit():
-                                result["uarfcn"] = int(uarfcn)
-                        if len(values) >= 10:  # PSC
-                            psc = values[9].strip()
-                            if psc.isdigit():
-                                result["psc"] = int(psc)
-                        if len(values) >= 11:  # RSCP
-                            rscp = values[10].strip()
-                            if rscp.isdigit():
-                                result["rscp"] = int(rscp)
-                        if len(values) >= 12:  # ECNO
-                            ecno = values[11].strip()
-                            if ecno.isdigit():
-                                result["ecno"] = int(ecno)
-                    
-                    elif rat_type in ["LTE", "CAT-M", "NB-IoT"]:
-                        # LTE parsing
-                        if len(values) >= 4:  # MCC
-                            result["mcc"] = values[3].strip('"')
-                        if len(values) >= 5:  # MNC
-                            result["mnc"] = values[4].strip('"')
-                        if len(values) >= 7:  # TAC
-                            tac = values[6].strip()
-                            if tac.isdigit():
-                                result["tac"] = int(tac)
-                        if len(values) >= 8:  # Cell ID
-                            cell_id = values[7].strip()
-                            if cell_id.isdigit():
-                                result["cell_id"] = int(cell_id)
-                        if len(values) >= 9:  # PCID
-                            pcid = values[8].strip()
-                            if pcid.isdigit():
-                                result["pcid"] = int(pcid)
-                        if len(values) >= 10:  # EARFCN
-                            earfcn = values[9].strip()
-                            if earfcn.isdigit():
-                                result["earfcn"] = int(earfcn)
-                        if len(values) >= 11:  # Band
-                            band = values[10].strip()
-                            result["band_num"] = band
-                        if len(values) >= 12:  # Bandwidth (MHz)
-                            bw = values[11].strip()
-                            if bw.isdigit():
-                                result["bandwidth"] = int(bw)
-                        if len(values) >= 13:  # RSRP
-                            rsrp = values[12].strip()
-                            if rsrp.lstrip("-").isdigit():
-                                result["rsrp"] = int(rsrp)
-                        if len(values) >= 14:  # RSRQ
-                            rsrq = values[13].strip()
-                            if rsrq.lstrip("-").isdigit():
-                                result["rsrq"] = int(rsrq)
-                        if len(values) >= 15:  # RSSI
-                            rssi = values[14].strip()
-                            if rssi.lstrip("-").isdigit():
-                                result["rssi"] = int(rssi)
-                        if len(values) >= 16:  # SINR
-                            sinr = values[15].strip()
-                            if sinr.lstrip("-").isdigit():
-                                result["sinr"] = int(sinr)
+                    layout = _SERVING_CELL_LAYOUTS.get("LTE" if rat_type in _LTE_SYSTEM_MODES else rat_type)
+                    if layout:
+                        # zip stops at the shorter sequence, so fields the
+                        # modem didn't report are simply skipped
+                        for field, raw in zip(layout, values[3:]):
+                            if field:
+                                key, convert = field
+                                value = convert(raw)
+                                if value is not None:
+                                    result[key] = value
             except (ValueError, IndexError):
                 pass
 
@@ -617,298 +606,409 @@ def _parse_quectel_neighbor_cells(lines: List[str], result: Dict[str, Any]) -> N
         lines: Response lines from the modem
         result: Dictionary to update with parsed values
     """
-    neighbor_cells = []
+    neighbor_cells: List[Dict[str, Any]] = []
     current_rat = None
     
     for line in lines:
-        if "+QENG:" in line:
-            parts = line.split(":", 1)
-            if len(parts) < 2:
-                continue
+        _, separator, tail = line.partition(":")
+        if not separator:
+            continue
                 
-            values = parts[1].strip().split(",")
-            if len(values) < 2:
-                continue
+        values = tail.strip().split(",")
+        if len(values) < 2:
+            continue
                 
-            try:
-                if values[0].strip() == "neighbourcell":
-                    current_rat = values[1].strip('"')
-                elif values[0].strip() == "intra":
-                    # Intra-frequency cell
-                    cell = {"type": "intra", "rat": current_rat}
+        try:
+            if values[0].strip() == "neighbourcell":
+                current_rat = values[1].strip('"')
+            elif values[0].strip() == "intra":
+                # Intra-frequency cell
+                cell = {"type": "intra", "rat": current_rat}
                     
-                    if current_rat == "GSM":
-                        if len(values) >= 2:  # ARFCN
-                            arfcn = values[1].strip()
-                            if arfcn.isdigit():
-                                cell["arfcn"] = int(arfcn)
-                        if len(values) >= 3:  # BSIC
-                            bsic = values[2].strip()
-                            if bsic.isdigit():
-                                cell["bsic"] = int(bsic)
-                        if len(values) >= 4:  # RxLev
-                            rxlev = values[3].strip()
-                            if rxlev.isdigit():
-                                cell["rxlev"] = int(rxlev)
+                if current_rat == "GSM":
+                    if len(values) >= 2:  # ARFCN
+                        arfcn = values[1].strip()
+                        if arfcn.isdigit():
+                            cell["arfcn"] = int(arfcn)
+                    if len(values) >= 3:  # BSIC
+                        bsic = values[2].strip()
+                        if bsic.isdigit():
+                            cell["bsic"] = int(bsic)
+                    if len(values) >= 4:  # RxLev
+                        rxlev = values[3].strip()
+                        if rxlev.isdigit():
+                            cell["rxlev"] = int(rxlev)
                     
-                    elif current_rat == "WCDMA":
-                        if len(values) >= 2:  # UARFCN
-                            uarfcn = values[1].strip()
-                            if uarfcn.isdigit():
-                                cell["uarfcn"] = int(uarfcn)
-                        if len(values) >= 3:  # PSC
-                            psc = values[2].strip()
-                            if psc.isdigit():
-                                cell["psc"] = int(psc)
-                        if len(values) >= 4:  # RSCP
-                            rscp = values[3].strip()
-                            if rscp.isdigit():
-                                cell["rscp"] = int(rscp)
-                        if len(values) >= 5:  # ECNO
-                            ecno = values[4].strip()
-                            if ecno.isdigit():
-                                cell["ecno"] = int(ecno)
+                elif current_rat == "WCDMA":
+                    if len(values) >= 2:  # UARFCN
+                        uarfcn = values[1].strip()
+                        if uarfcn.isdigit():
+                            cell["uarfcn"] = int(uarfcn)
+                    if len(values) >= 3:  # PSC
+                        psc = values[2].strip()
+                        if psc.isdigit():
+                            cell["psc"] = int(psc)
+                    if len(values) >= 4:  # RSCP
+                        rscp = values[3].strip()
+                        if rscp.isdigit():
+                            cell["rscp"] = int(rscp)
+                    if len(values) >= 5:  # ECNO
+                        ecno = values[4].strip()
+                        if ecno.isdigit():
+                            cell["ecno"] = int(ecno)
                     
-                    elif current_rat in ["LTE", "CAT-M", "NB-IoT"]:
-                        if len(values) >= 2:  # EARFCN
-                            earfcn = values[1].strip()
-                            if earfcn.isdigit():
-                                cell["earfcn"] = int(earfcn)
-                        if len(values) >= 3:  # PCID
-                            pcid = values[2].strip()
-                            if pcid.isdigit():
-                                cell["pcid"] = int(pcid)
-                        if len(values) >= 4:  # RSRP
-                            rsrp = values[3].strip()
-                            if rsrp.lstrip("-").isdigit():
-                                cell["rsrp"] = int(rsrp)
-                        if len(values) >= 5:  # RSRQ
-                            rsrq = values[4].strip()
-                            if rsrq.lstrip("-").isdigit():
-                                cell["rsrq"] = int(rsrq)
-                        if len(values) >= 6:  # RSSI
-                            rssi = values[5].strip()
-                            if rssi.lstrip("-").isdigit():
-                                cell["rssi"] = int(rssi)
-                        if len(values) >= 7:  # SINR
-                            sinr = values[6].strip()
-                            if sinr.lstrip("-").isdigit():
-                                cell["sinr"] = int(sinr)
+                elif current_rat in _LTE_SYSTEM_MODES:
+                    if len(values) >= 2:  # EARFCN
+                        earfcn = values[1].strip()
+                        if earfcn.isdigit():
+                            cell["earfcn"] = int(earfcn)
+                    if len(values) >= 3:  # PCID
+                        pcid = values[2].strip()
+                        if pcid.isdigit():
+                            cell["pcid"] = int(pcid)
+                    if len(values) >= 4:  # RSRP
+                        rsrp = values[3].strip()
+                        if rsrp.lstrip("-").isdigit():
+                            cell["rsrp"] = int(rsrp)
+                    if len(values) >= 5:  # RSRQ
+                        rsrq = values[4].strip()
+                        if rsrq.lstrip("-").isdigit():
+                            cell["rsrq"] = int(rsrq)
+                    if len(values) >= 6:  # RSSI
+                        rssi = values[5].strip()
+                        if rssi.lstrip("-").isdigit():
+                            cell["rssi"] = int(rssi)
+                    if len(values) >= 7:  # SINR
+                        sinr = values[6].strip()
+                        if sinr.lstrip("-").isdigit():
+                            cell["sinr"] = int(sinr)
                     
-                    neighbor_cells.append(cell)
+                neighbor_cells.append(cell)
                 
-                elif values[0].strip() == "inter":
-                    # Inter-frequency cell
-                    cell = {"type": "inter", "rat": current_rat}
+            elif values[0].strip() == "inter":
+                # Inter-frequency cell
+                cell = {"type": "inter", "rat": current_rat}
                     
-                    # Parse based on RAT - similar to intra but with potential differences
-                    # Add parsing logic similar to intra for different RATs
+                # Parse based on RAT - similar to intra but with potential differences
+                # Add parsing logic similar to intra for different RATs
                     
-                    neighbor_cells.append(cell)
-            except (ValueError, IndexError):
-                pass
+                neighbor_cells.append(cell)
+        except (ValueError, IndexError):
+            pass
     
     if neighbor_cells:
         result["neighbor_cells"] = neighbor_cells
 
 
-def parse_modem_info(command: str, response: str) -> Dict[str, Any]:
+def _parse_simple_info(key: str, lines: List[str], result: Dict[str, Any]) -> None:
     """
-    Parse modem information from command response.
+    Parse an identity query answered with the bare value.
+    
+    Args:
+        key: Result key the value is stored under
+        lines: Response lines from the modem
+        result: Dictionary to update with parsed values
+    """
+    if lines:
+        result[key] = lines[0]
+
+
+def _parse_iccid(lines: List[str], result: Dict[str, Any]) -> None:
+    """
+    Parse the SIM ICCID.
+    
+    Args:
+        lines: Response lines from the modem
+        result: Dictionary to update with parsed values
+    """
+    if lines:
+        if "+ICCID:" in lines[0]:
+            result["iccid"] = lines[0].partition("+ICCID:")[2].strip()
+        else:
+            result["iccid"] = lines[0]
+
+
+def _parse_preferred_operators(lines: List[str], result: Dict[str, Any]) -> None:
+    """
+    Parse the preferred operator list.
+    
+    Args:
+        lines: Response lines from the modem
+        result: Dictionary to update with parsed values
+    """
+    result["preferred_operators"] = [line.partition(":")[2].strip() for line in lines]
+
+
+def _parse_plmn_selector(lines: List[str], result: Dict[str, Any]) -> None:
+    """
+    Parse the selected preferred PLMN list.
+    
+    Args:
+        lines: Response lines from the modem
+        result: Dictionary to update with parsed values
+    """
+    for line in lines:
+        value = line.partition(":")[2].strip()
+        result["plmn_selector"] = _PLMN_SELECTOR_NAMES.get(value, f"Unknown ({value})")
+
+
+def _parse_quectel_netinfo(lines: List[str], result: Dict[str, Any]) -> None:
+    """
+    Parse Quectel network information (timing advance, DRX, etc.).
+    
+    Args:
+        lines: Response lines from the modem
+        result: Dictionary to update with parsed values
+    """
+    for line in lines:
+        _, separator, tail = line.partition(":")
+        if separator:
+            values = tail.strip().split(",")
+            if len(values) >= 3:
+                if values[0] == "2" and values[1] == "1":  # RSSSNR
+                    if len(values) >= 3 and values[2].strip():
+                        result["rsssnr"] = values[2].strip()
+                elif values[0] == "2" and values[1] == "2":  # Timing Advance
+                    if len(values) >= 3 and values[2].strip():
+                        result["timing_advance"] = values[2].strip()
+                elif values[0] == "2" and values[1] == "4":  # DRX
+                    if len(values) >= 3 and values[2].strip():
+                        result["drx"] = values[2].strip()
+
+
+# Parses a command's response lines into the result dict
+_Handler = Callable[[List[str], Dict[str, Any]], None]
+
+# Result categories: modem information (identity, SIM, operator lists) and
+# cell information (registration, signal, serving/neighbour cells)
+MODEM_INFO = "modem"
+CELL_INFO = "cell"
+
+# Handler registry mapping each category's commands to (response prefix,
+# handler). Keys are the exact command form that is parsed: read commands
+# with their "?" suffix, and commands whose arguments select the response
+# (AT+QENG, AT+QNETINFO) with those arguments. Set and test ("=?") forms of a
+# command are deliberately absent, since their responses have a different
+# layout from what the handlers expect. Handlers only see lines starting
+# with the response prefix, or every line when the prefix is None (bare-value
+# responses). A command can be registered under both categories (AT+COPS).
+# AT commands are case-insensitive, so keys are upper-case and commands are
+# upper-cased before lookup.
+_HANDLERS: Dict[str, Dict[str, Tuple[Optional[str], _Handler]]] = {
+    MODEM_INFO: {
+        **{command: (None, partial(_parse_simple_info, key)) for command, key in _SIMPLE_INFO_KEYS.items()},
+        "AT+CICCID": (None, _parse_iccid),  # SIM ICCID
+        "AT+COPS?": ("+COPS:", partial(_apply_schema, *_RESPONSE_SCHEMAS["AT+COPS?"])),  # Current operator
+        "AT+CPOL?": ("+CPOL:", _parse_preferred_operators),  # Preferred operator list
+        "AT+CPLS?": ("+CPLS:", _parse_plmn_selector),  # Preferred PLMN list
+    },
+    CELL_INFO: {
+        # Network registration status, one per radio technology
+        "AT+CREG?": ("+CREG:", partial(_parse_network_registration, "GSM")),
+        "AT+CGREG?": ("+CGREG:", partial(_parse_network_registration, "UMTS")),
+        "AT+CEREG?": ("+CEREG:", partial(_parse_network_registration, "LTE")),
+        "AT+CSQ": ("+CSQ:", _parse_signal_quality),  # Signal quality
+        "AT+CESQ": ("+CESQ:", _parse_extended_signal_quality),  # Extended signal quality
+        "AT+CGATT?": ("+CGATT:", _parse_gprs_attachment),  # GPRS attachment status
+        "AT+COPS?": ("+COPS:", _parse_current_operator),  # Current operator
+        "AT+CFUN?": ("+CFUN:", _parse_functionality_status),  # Functionality status
+        "AT+CCLK?": ("+CCLK:", _parse_real_time_clock),  # Real-time clock
+        # Quectel-specific commands
+        "AT+QCSQ": ("+QCSQ:", _parse_quectel_signal_quality),
+        "AT+QNWINFO": ("+QNWINFO:", _parse_quectel_network_info),
+        'AT+QENG="SERVINGCELL"': ("+QENG:", _parse_quectel_serving_cell),
+        'AT+QENG="NEIGHBOURCELL"': ("+QENG:", _parse_quectel_neighbor_cells),
+        "AT+QSPN": ("+QSPN:", partial(_apply_schema, *_RESPONSE_SCHEMAS["AT+QSPN"])),
+        # Quectel network information: RSSSNR, timing advance and DRX
+        "AT+QNETINFO=2,1": ("+QNETINFO:", _parse_quectel_netinfo),
+        "AT+QNETINFO=2,2": ("+QNETINFO:", _parse_quectel_netinfo),
+        "AT+QNETINFO=2,4": ("+QNETINFO:", _parse_quectel_netinfo),
+    },
+}
+
+
+def _prep_lines(command: str, response: str, tag: Optional[str] = None) -> List[str]:
+    """
+    Split a response into stripped, non-empty lines without echo or final OK.
     
     Args:
         command: The AT command that was sent
         response: The response from the modem
+        tag: Response prefix (e.g. "+CSQ:"); if given, only lines starting
+            with it are kept, so handlers needn't rescan for it
         
     Returns:
-        Dict[str, Any]: Parsed modem information
+        List[str]: Response lines with the command echo and trailing OK
+            removed, or no lines at all if the modem answered with an error
     """
-    result = {}
+    lines = [stripped for line in response.splitlines() if (stripped := line.strip())]
     
     # Remove command echo if present
-    lines = [line.strip() for line in response.split('\n') if line.strip()]
     if lines and lines[0] == command.strip():
-        lines = lines[1:]
+        del lines[0]
     
     # Remove OK response if present
     if lines and lines[-1] == "OK":
-        lines = lines[:-1]
-    
-    # Parse based on command
-    if command.startswith("AT+CGMI"):  # Manufacturer
-        if len(lines) > 0 and "ERROR" not in lines[0]:
-            result["cgmi"] = lines[0]
+        lines.pop()
     
-    elif command.startswith("AT+CGMM"):  # Model
-        if len(lines) > 0 and "ERROR" not in lines[0]:
-            result["cgmm"] = lines[0]
+    # An error answer carries nothing for the handlers to parse
+    if lines and "ERROR" in lines[0]:
+        return []
     
-    elif command.startswith("AT+CGMR"):  # Firmware version
-        if len(lines) > 0 and "ERROR" not in lines[0]:
-            result["cgmr"] = lines[0]
+    if tag:
+        lines = [line for line in lines if line.startswith(tag)]
     
-    elif command.startswith("AT+CGSN"):  # Serial number
-        if len(lines) > 0 and "ERROR" not in lines[0]:
-            result["cgsn"] = lines[0]
+    return lines
+
+
+def _lookup_handler(category: str, command: str) -> Optional[Tuple[Optional[str], _Handler]]:
+    """
+    Find the response handler for a command.
     
-    elif command.startswith("AT+CIMI"):  # IMSI
-        if len(lines) > 0 and "ERROR" not in lines[0]:
-            result["cimi"] = lines[0]
+    Args:
+        category: Result category to look the command up in (MODEM_INFO or CELL_INFO)
+        command: The AT command that was sent
+        
+    Returns:
+        Optional[Tuple[Optional[str], _Handler]]: (response prefix, handler)
+            for the command, or None if it has none
+    """
+    return _HANDLERS[category].get(command.strip().upper())
+
+
+def _parse_response(category: str, command: str, response: str, result: Dict[str, Any]) -> None:
+    """
+    Parse a response with the command's handler for a category.
     
-    elif command.startswith("AT+CICCID"):  # SIM ICCID
-        if len(lines) > 0 and "ERROR" not in lines[0]:
-            if "+ICCID:" in lines[0]:
-                result["iccid"] = lines[0].split("+ICCID:")[1].strip()
-            else:
-                result["iccid"] = lines[0]
+    Args:
+        category: Result category to parse for (MODEM_INFO or CELL_INFO)
+        command: The AT command that was sent
+        response: The response from the modem
+        result: Dictionary to update with parsed values; left unchanged if
+            the command has no handler in the category
+    """
+    entry = _lookup_handler(category, command)
+    if entry:
+        tag, handler = entry
+        handler(_prep_lines(command, response, tag), result)
+
+
+@lru_cache(maxsize=256)
+def _parse_modem_info_cached(command: str, response: str) -> Tuple[Tuple[str, Any], ...]:
+    """
+    Parse modem information into an immutable, cacheable form.
     
-    elif command.startswith("AT+COPS?"):  # Current operator
-        for line in lines:
-            if "+COPS:" in line:
-                parts = line.split(",")
-                if len(parts) >= 3:
-                    result["operator_mode"] = parts[0].split(":")[1].strip()
-                    result["operator_format"] = parts[1].strip()
-                    result["operator_name"] = parts[2].strip().strip('"')
-                    if len(parts) >= 4:
-                        result["act"] = parts[3].strip()
+    Modem information (identity, SIM, operator lists) rarely changes within a
+    session, so identical responses are parsed once. List values are stored
+    as tuples so callers can't alter the cached result.
     
-    elif command.startswith("AT+CPOL?"):  # Preferred operator list
-        result["preferred_operators"] = []
-        for line in lines:
-            if "+CPOL:" in line:
-                result["preferred_operators"].append(line.split(":", 1)[1].strip())
+    Args:
+        command: The AT command that was sent
+        response: The response from the modem
+        
+    Returns:
+        Tuple[Tuple[str, Any], ...]: Parsed (key, value) pairs
+    """
+    result: Dict[str, Any] = {}
+    _parse_response(MODEM_INFO, command, response, result)
+    return tuple((key, tuple(value) if isinstance(value, list) else value)
+                 for key, value in result.items())
+
+
+def parse_modem_info(command: str, response: str) -> Dict[str, Any]:
+    """
+    Parse modem information from command response.
     
-    elif command.startswith("AT+CPLS?"):  # Preferred PLMN list
-        for line in lines:
-            if "+CPLS:" in line:
-                parts = line.split(":")
-                if len(parts) >= 2:
-                    value = parts[1].strip()
-                    if value == "0":
-                        result["plmn_selector"] = "User controlled PLMN selector with access technology"
-                    elif value == "1":
-                        result["plmn_selector"] = "Operator controlled PLMN selector with access technology"
-                    elif value == "2":
-                        result["plmn_selector"] = "HPLMN selector with access technology"
-                    else:
-                        result["plmn_selector"] = f"Unknown ({value})"
+    Args:
+        command: The AT command that was sent
+        response: The response from the modem
+        
+    Returns:
+        Dict[str, Any]: Parsed modem information
+    """
+    # Commands without a handler yield nothing; don't let their ever-changing
+    # responses churn the cache
+    if not _lookup_handler(MODEM_INFO, command):
+        return {}
     
-    return result
+    return {key: list(value) if isinstance(value, tuple) else value
+            for key, value in _parse_modem_info_cached(command, response)}
 
 
-def parse_cell_info(command: str, response: str) -> Dict[str, Any]:
+def parse_cell_info(command: str, response: str, timestamp: Optional[str] = None) -> Dict[str, Any]:
     """
     Parse cell information from command response.
     
     Args:
         command: The AT command that was sent
         response: The response from the modem
+        timestamp: ISO timestamp to record, defaults to the current time. Pass
+            one shared value when parsing a burst of commands from one poll.
         
     Returns:
         Dict[str, Any]: Parsed cell information
     """
-    result = {}
-    current_time = datetime.now()
+    result: Dict[str, Any] = {}
     
     # Add timestamp
-    result["timestamp"] = current_time.isoformat()
-    
-    # Remove command echo if present
-    lines = [line.strip() for line in response.split('\n') if line.strip()]
-    if lines and lines[0] == command.strip():
-        lines = lines[1:]
-    
-    # Remove OK response if present
-    if lines and lines[-1] == "OK":
-        lines = lines[:-1]
+    result["timestamp"] = timestamp if timestamp is not None else datetime.now().isoformat()
     
     # Parse based on command
-    if command.startswith("AT+CREG?") or command.startswith("AT+CGREG?") or command.startswith("AT+CEREG?"):
-        # Network registration status
-        _parse_network_registration(command, lines, result)
-    
-    elif command.startswith("AT+CSQ"):
-        # Signal quality
-        _parse_signal_quality(lines, result)
-    
-    elif command.startswith("AT+CESQ"):
-        # Extended signal quality
-        _parse_extended_signal_quality(lines, result)
-    
-    elif command.startswith("AT+CGATT?"):
-        # GPRS attachment status
-        _parse_gprs_attachment(lines, result)
-    
-    elif command.startswith("AT+COPS?"):
-        # Current operator
-        _parse_current_operator(lines, result)
-    
-    elif command.startswith("AT+CFUN?"):
-        # Functionality status
-        _parse_functionality_status(lines, result)
-    
-    elif command.startswith("AT+CCLK?"):
-        # Real-time clock
-        _parse_real_time_clock(lines, result)
-    
-    # Quectel-specific commands
-    elif command.startswith("AT+QCSQ"):
-        # Quectel extended signal quality
-        _parse_quectel_signal_quality(lines, result)
-    
-    elif command.startswith("AT+QNWINFO"):
-        # Quectel network information
-        _parse_quectel_network_info(lines, result)
-    
-    elif command.startswith('AT+QENG="servingcell"'):
-        # Quectel serving cell information
-        _parse_quectel_serving_cell(lines, result)
-    
-    elif command.startswith('AT+QENG="neighbourcell"'):
-        # Quectel neighbor cell information
-        _parse_quectel_neighbor_cells(lines, result)
-    
-    elif command.startswith("AT+QSPN"):
-        # Quectel service provider name
-        for line in lines:
-            if "+QSPN:" in line:
-                parts = line.split(":", 1)
-                if len(parts) >= 2:
-                    values = parts[1].strip().split(",")
-                    if len(values) >= 1:
-                        result["operator_full"] = values[0].strip('"')
-                    if len(values) >= 2:
-                        result["operator_short"] = values[1].strip('"')
-                    if len(values) >= 4:
-                        result["spn_mcc"] = values[2].strip('"')
-                        result["spn_mnc"] = values[3].strip('"')
-    
-    elif command.startswith("AT+QNETINFO"):
-        # Quectel network information (timing advance, DRX, etc.)
-        for line in lines:
-            if "+QNETINFO:" in line:
-                parts = line.split(":", 1)
-                if len(parts) >= 2:
-                    values = parts[1].strip().split(",")
-                    if len(values) >= 3:
-                        if values[0] == "2" and values[1] == "1":  # RSSSNR
-                            if len(values) >= 3 and values[2].strip():
-                                result["rsssnr"] = values[2].strip()
-                        elif values[0] == "2" and values[1] == "2":  # Timing Advance
-                            if len(values) >= 3 and values[2].strip():
-                                result["timing_advance"] = values[2].strip()
-                        elif values[0] == "2" and values[1] == "4":  # DRX
-                            if len(values) >= 3 and values[2].strip():
-                                result["drx"] = values[2].strip()
+    _parse_response(CELL_INFO, command, response, result)
     
     return result
 
 
+# Cell data CSV columns, also the columns of the in-memory cell history
+CELL_DATA_FIELDS = (
+    "timestamp", "latitude", "longitude",
+    "mcc", "mnc", "lac", "cell_id", "technology",
+    "rssi", "rsrp", "rsrq", "sinr", "band", "bandwidth", "frequency",
+    # Additional fields from enhanced parsing
+    "registration_status", "access_technology", "gprs_status",
+    "operator", "operator_selection_mode", "act",
+    "functionality", "fix", "satellites", "hdop", "altitude",
+    "speed_kmh", "cog",
+)
+
+# numpy dtypes for the numeric cell history columns in history_arrays().
+# Measurements are downcast to compact types; coordinates stay float64 for
+# precision and identifiers stay int64. Columns not listed hold text and are
+# returned as object arrays.
+_HISTORY_DTYPES = {
+    "latitude": "float64",
+    "longitude": "float64",
+    "lac": "int64",
+    "cell_id": "int64",
+    "rssi": "float32",
+    "rsrp": "float32",
+    "rsrq": "float32",
+    "sinr": "float32",
+    "bandwidth": "int16",
+    "satellites": "int16",
+    "hdop": "float32",
+    "altitude": "float32",
+    "speed_kmh": "float32",
+    "cog": "float32",
+}
+
+# Float dtype an integer column falls back to when it has missing values,
+# which are stored as NaN
+_HISTORY_INT_FALLBACK = {"int16": "float32", "int64": "float64"}
+
+
 class ModemResponseParser:
     """Handles parsing of modem responses and saves data to various formats."""
     
-    def __init__(self, csv_dir: str, csv_filename: str, json_dir: Optional[str] = None, json_filename: Optional[str] = None, logger = None):
+    # Modem information fields written to the JSON file
+    JSON_MODEM_INFO_FIELDS = ("cgmi", "cgmm", "cgmr", "cgsn", "cimi")
+    
+    # Fields that identify a cell or position; a record needs at least one of them
+    _MIN_KEYS = frozenset({"cell_id", "rssi", "latitude", "longitude", "lac", "operator"})
+    
+    def __init__(self, csv_dir: str, csv_filename: str, json_dir: Optional[str] = None, json_filename: Optional[str] = None,
+                 logger: Optional[ModemLogger] = None,
+                 timestamp: Optional[str] = None, flush_every: int = 16):
         """
         Initialize the parser.
         
@@ -918,47 +1018,66 @@ class ModemResponseParser:
             json_dir: Directory for JSON output, defaults to csv_dir if None
             json_filename: Base filename for JSON output, defaults to "modem_info.json" if None
             logger: Logger instance for logging messages
+            timestamp: Filename prefix for the output files, defaults to the
+                current time formatted as "%Y%m%d_%H%M%S"
+            flush_every: Number of cell records to buffer before appending them
+                to the CSV file
         """
-        self.csv_dir = csv_dir
+        self.csv_dir = Path(csv_dir)
         self.csv_filename = csv_filename
-        self.json_dir = json_dir if json_dir else csv_dir
+        self.json_dir = Path(json_dir) if json_dir else self.csv_dir
         self.json_filename = json_filename if json_filename else "modem_info.json"
         self.logger = logger
         
-        # Create output directories if they don't exist
-        os.makedirs(csv_dir, exist_ok=True)
-        os.makedirs(self.json_dir, exist_ok=True)
+        # Create output directories if they don't exist. This is done once here
+        # so that none of the per-record write paths need to check them again.
+        self.csv_dir.mkdir(parents=True, exist_ok=True)
+        if self.json_dir != self.csv_dir:
+            self.json_dir.mkdir(parents=True, exist_ok=True)
         
         # Store parsed data
-        self.modem_info = {}
-        self.current_cell_data = {}
-        self.cell_history = []
+        self.modem_info: Dict[str, Any] = {}
+        # Contents of the modem info JSON file, kept between writes so only
+        # changed fields are updated, and whether it differs from the file
+        self._json_output: Dict[str, Any] = {"host_timestamp": None}
+        self._json_dirty = True
+        # host_timestamp text for the current second, reused by every write
+        # within that second
+        self._timestamp_second = -1
+        self._timestamp_text = ""
+        self.current_cell_data: Dict[str, Any] = {}
+        # Saved cell records, stored column-wise: one list per CSV field, with
+        # None where a record lacked the field. Scanning one field across the
+        # history (e.g. RSSI over a drive) then touches only that list.
+        self.cell_columns: Dict[str, List[Any]] = {field: [] for field in CELL_DATA_FIELDS}
         
         # Set up CSV files
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.cell_csv_path = os.path.join(csv_dir, f"{timestamp}_{csv_filename}")
-        self.json_path = os.path.join(self.json_dir, f"{timestamp}_{self.json_filename}")
+        if timestamp is None:
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+        self.cell_csv_path = self.csv_dir / f"{timestamp}_{csv_filename}"
+        self.json_path = self.json_dir / f"{timestamp}_{self.json_filename}"
+        
+        # Column headers for cell data CSV
+        self.cell_data_fields = list(CELL_DATA_FIELDS)
         
-        # Column headers for cell data CSV - adjusted to include all possible fields
-        self.cell_data_fields = [
-            "timestamp", "latitude", "longitude", 
-            "mcc", "mnc", "lac", "cell_id", "technology",
-            "rssi", "rsrp", "rsrq", "sinr", "band", "bandwidth", "frequency",
-            # Additional fields from enhanced parsing
-            "registration_status", "access_technology", "gprs_status",
-            "operator", "operator_selection_mode", "act",
-            "functionality", "fix", "satellites", "hdop", "altitude",
-            "speed_kmh", "cog"
-        ]
+        # The cell data CSV stays open for the life of the parser. Records
+        # collect in a 128 KiB buffer and are written and synced to storage
+        # in batches, which matters when the output is on slow storage such as
+        # an SD card.
+        self._cell_buffer = io.BufferedWriter(self.cell_csv_path.open('wb', buffering=0), buffer_size=1 << 17)
+        self._cell_file = io.TextIOWrapper(self._cell_buffer, encoding='utf-8', newline='')
+        self._cell_writer = csv.writer(self._cell_file)
+        self._unflushed_rows = 0
+        self._flush_every = max(1, flush_every)
+        # Make sure buffered records reach the file even if close() isn't called
+        atexit.register(self.close)
         
         # Initialize cell data CSV
-        with open(self.cell_csv_path, 'w', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=self.cell_data_fields)
-            writer.writeheader()
+        self._cell_writer.writerow(self.cell_data_fields)
+        self._cell_file.flush()
         
         # Initialize JSON file with empty object
-        with open(self.json_path, 'w') as f:
-            json.dump({}, f, indent=2)
+        self._replace_json_file({})
             
         # Log file creation if logger is available
         if self.logger:
@@ -988,19 +1107,20 @@ class ModemResponseParser:
         
         return result
     
-    def parse_cell_info(self, command: str, response: str) -> Dict[str, Any]:
+    def parse_cell_info(self, command: str, response: str, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """
         Parse cell information from command response and save to files.
         
         Args:
             command: The AT command that was sent
             response: The response from the modem
+            timestamp: ISO timestamp to record, defaults to the current time
             
         Returns:
             Dict[str, Any]: Parsed cell information
         """
         # Use the standalone parsing function
-        result = parse_cell_info(command, response)
+        result = parse_cell_info(command, response, timestamp)
         
         # Update current cell data
         self.current_cell_data.update(result)
@@ -1019,24 +1139,71 @@ class ModemResponseParser:
             bool: True if we have minimum data, False otherwise
         """
         # At minimum, we should have timestamp and some identifier for the cell
-        return ("timestamp" in self.current_cell_data and 
-                any(key in self.current_cell_data for key in 
-                    ["cell_id", "rssi", "latitude", "longitude", "lac", "operator"]))
+        return ("timestamp" in self.current_cell_data and
+                not self._MIN_KEYS.isdisjoint(self.current_cell_data))
     
     def _save_cell_record(self) -> None:
         """Save the current cell data as a record and append to CSV."""
-        # Make a copy of the current data
-        record = self.current_cell_data.copy()
+        # Take the CSV fields from the current data; csv writes the None of a
+        # missing field as an empty cell
+        data = self.current_cell_data
+        row = [data.get(field) for field in CELL_DATA_FIELDS]
         
         # Add to history
-        self.cell_history.append(record)
+        for column, value in zip(self.cell_columns.values(), row):
+            column.append(value)
+        
+        # Write the row and push the batch to the file once it is full
+        self._cell_writer.writerow(row)
+        self._unflushed_rows += 1
+        if self._unflushed_rows >= self._flush_every:
+            self.flush()
+    
+    def history_arrays(self) -> Dict[str, Any]:
+        """
+        Get the cell history as numpy arrays with compact dtypes.
+        
+        Numeric columns use the dtypes in _HISTORY_DTYPES. Missing and
+        non-numeric values (such as an "unknown" RSSI) become NaN, so an
+        integer column with gaps is returned as the float type of matching
+        width. Text columns are returned as object arrays.
+        
+        Returns:
+            Dict[str, numpy.ndarray]: One array per CSV field
+            
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        import numpy as np
         
-        # Write to CSV
-        with open(self.cell_csv_path, 'a', newline='') as f:
-            writer = csv.DictWriter(f, fieldnames=self.cell_data_fields)
-            # Fill in missing fields with empty strings
-            row = {field: record.get(field, "") for field in self.cell_data_fields}
-            writer.writerow(row)
+        arrays = {}
+        for field, values in self.cell_columns.items():
+            dtype = _HISTORY_DTYPES.get(field)
+            if dtype is None:
+                arrays[field] = np.array(values, dtype=object)
+                continue
+            
+            numbers = [value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+                       for value in values]
+            if None in numbers:
+                dtype = _HISTORY_INT_FALLBACK.get(dtype, dtype)
+                numbers = [np.nan if value is None else value for value in numbers]
+            arrays[field] = np.array(numbers, dtype=dtype)
+        return arrays
+    
+    def flush(self) -> None:
+        """Write any buffered cell records to the CSV file and sync it to storage."""
+        if self._unflushed_rows and not self._cell_file.closed:
+            self._cell_file.flush()
+            os.fsync(self._cell_buffer.raw.fileno())
+            self._unflushed_rows = 0
+    
+    def close(self) -> None:
+        """Write any buffered cell records, close the CSV file and stop tracking this parser for exit."""
+        if not self._cell_file.closed:
+            self.flush()
+            self._cell_file.close()
+        atexit.unregister(self.close)
     
     def _write_modem_info_json(self) -> None:
         """Write modem information to JSON file."""
@@ -1044,19 +1211,50 @@ class ModemResponseParser:
         if not self.modem_info:
             return
         
-        # Create a structured output
-        output_data = {
-            "host_timestamp": datetime.now().isoformat()
-        }
+        # Update only the fields whose values changed since the last write
+        for key in self.JSON_MODEM_INFO_FIELDS:
+            if key in self.modem_info and self._json_output.get(key) != self.modem_info[key]:
+                self._json_output[key] = self.modem_info[key]
+                self._json_dirty = True
+        
+        # Skip the write if nothing changed, so repeated polls returning the
+        # same modem information don't rewrite the file
+        if not self._json_dirty:
+            return
+        self._json_output["host_timestamp"] = self._host_timestamp()
+        self._replace_json_file(self._json_output)
+        self._json_dirty = False
+    
+    def _host_timestamp(self) -> str:
+        """
+        Get the current local time as an ISO 8601 string, to the second.
+        
+        Returns:
+            str: Timestamp such as "2024-01-02T13:45:07"
+        """
+        second = int(time.time())
+        if second != self._timestamp_second:
+            self._timestamp_second = second
+            self._timestamp_text = datetime.fromtimestamp(second).isoformat()
+        return self._timestamp_text
+    
+    def _replace_json_file(self, data: Dict[str, Any]) -> None:
+        """
+        Replace the modem info JSON file atomically.
         
-        # Add basic modem information fields
-        for key in ["cgmi", "cgmm", "cgmr", "cgsn", "cimi"]:
-            if key in self.modem_info:
-                output_data[key] = self.modem_info[key]
+        The data is written to a temporary file next to it and moved into
+        place, so a reader never sees a half-written file.
         
-        # Write to file
-        with open(self.json_path, 'w') as f:
-            json.dump(output_data, f, indent=2)
+        Args:
+            data: JSON-serializable data to write
+        """
+        temp_path = self.json_path.with_name(f"{self.json_path.name}.tmp")
+        if orjson is not None:
+            temp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with temp_path.open('w') as f:
+                json.dump(data, f, indent=2)
+        temp_path.replace(self.json_path)
 
     def save_gpsd_data(self, gpsd_fix: Dict[str, Any]) -> None:
         """
@@ -1071,14 +1269,12 @@ class ModemResponseParser:
         try:
             # Generate a timestamp for the filename
             timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-            # Correctly join the path for the GPSd data file
-            gpsd_filename = os.path.join(self.json_dir, f"{timestamp}_gpsd_data.json")
-
-            # Ensure the directory exists
-            os.makedirs(self.json_dir, exist_ok=True)
+            # Correctly join the path for the GPSd data file (the directory
+            # was created in __init__)
+            gpsd_filename = self.json_dir / f"{timestamp}_gpsd_data.json"
 
             # Write the data to the file
-            with open(gpsd_filename, 'w') as f:
+            with gpsd_filename.open('w') as f:
                 json.dump(gpsd_fix, f, indent=4)
             
             if self.logger:
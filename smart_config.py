@@ -6,12 +6,153 @@ settings against desired configuration and only applies changes when needed.
 This reduces flash memory wear by avoiding unnecessary writes.
 """
 
+import os
 import re  # Added re import
+import copy
+import glob
+import json
+import hashlib
 import yaml  # Added yaml import
-from typing import Dict, Any, Tuple, Optional, List
+from dataclasses import dataclass
+from functools import cached_property, lru_cache, partial
+from typing import Dict, Any, Callable, NamedTuple, Tuple, Optional, List, Pattern, Set
 from modem import ModemCommunicator
 from logger import ModemLogger
 
+# Use the LibYAML-backed loader when PyYAML was built with it (the standard
+# wheels are); it parses several times faster than the pure-Python one
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader  # type: ignore
+
+# orjson reads the configuration cache considerably faster than the stdlib json
+# module; use it when available, but don't require it
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+
+# Parsed configuration files, keyed by (absolute path, mtime in ns, size) so an
+# edited file is parsed again while repeated loads of an unchanged one aren't
+_YAML_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+# Default for settings missing from the configuration, so a single dict.get()
+# tells them apart from settings explicitly set to None
+_MISSING = object()
+
+# Suffix of the parsed configuration caches written next to the configuration
+# file ("<config file>.<content hash>.json"); ".cache" files are older pickles
+_CONFIG_CACHE_SUFFIX = re.compile(r'\.[0-9a-f]{32}\.(?:json|cache)')
+
+# Directory holding the per-modem "last applied" configuration snapshots
+_SNAPSHOT_DIR = os.path.join("~", ".cwd")
+
+# Query response patterns, compiled once at import time
+_CGSN_PATTERN = re.compile(r'(\d{8,})')
+_CMEE_PATTERN = re.compile(r'\+CMEE:\s*(\d+)')
+_QGPS_ON_PATTERN = re.compile(r'\+QGPS:\s*1')
+_CTZU_PATTERN = re.compile(r'\+CTZU:\s*(\d+)')
+
+# Every "+QGPSCFG: "<setting>",<value>" line, with the raw value text up to the end of the line
+_QGPSCFG_VALUE_PATTERN = re.compile(r'\+QGPSCFG:\s*"([^"]+)",[ \t]*([^\r\n]*)')
+
+
+def _parse_qgpscfg_values(response: str) -> Dict[str, str]:
+    """
+    Parse every QGPSCFG setting in a (possibly batched) query response.
+    
+    Args:
+        response: Response to one or more AT+QGPSCFG queries
+        
+    Returns:
+        Dict mapping setting names to their raw value text (e.g. '"usbnmea"' or '31,0')
+    """
+    return {match.group(1): match.group(2).strip() for match in _QGPSCFG_VALUE_PATTERN.finditer(response)}
+
+
+def _convert_qgpscfg_value(raw_value: str, value_type: type) -> Any:
+    """
+    Convert the raw value text of a single-valued QGPSCFG setting.
+    
+    Args:
+        raw_value: Raw value text from _parse_qgpscfg_values
+        value_type: Type of the value (str or int)
+        
+    Returns:
+        The converted value, or None if it isn't a valid value of that type
+    """
+    if value_type == str:
+        # Handles both quoted and unquoted string values
+        if raw_value.startswith('"'):
+            return raw_value[1:].partition('"')[0]
+        return raw_value.partition(',')[0].strip()
+    
+    first_field = raw_value.partition(',')[0].strip()
+    return int(first_field) if first_field.isdigit() else None
+
+
+def _search_int(pattern: Pattern[str], response: str) -> Optional[int]:
+    """Return the integer captured by a pattern's first group, or None if it doesn't match."""
+    match = pattern.search(response)
+    return int(match.group(1)) if match else None
+
+
+@lru_cache(maxsize=None)
+def _qopscfg_pattern(parameter: str) -> Pattern[str]:
+    """Return the compiled pattern for a numeric QOPSCFG parameter."""
+    return re.compile(rf'\+QOPSCFG:\s*"{re.escape(parameter)}",\s*(\d+)')
+
+
+@dataclass(frozen=True)
+class DesiredConfig:
+    """Desired modem settings from the configuration file, by section."""
+    
+    __slots__ = ('basic', 'network', 'gnss')
+    
+    basic: Dict[str, Any]
+    network: Dict[str, Any]
+    gnss: Dict[str, Any]
+    
+    @classmethod
+    def from_dict(cls, config: Optional[Dict[str, Any]]) -> 'DesiredConfig':
+        """
+        Build the desired configuration from a parsed configuration file.
+        
+        Args:
+            config: Parsed YAML document; missing or empty sections become empty dicts
+            
+        Returns:
+            DesiredConfig: The desired configuration
+        """
+        config = config or {}
+        return cls(
+            basic=config.get('basic') or {},
+            network=config.get('network') or {},
+            gnss=config.get('gnss') or {},
+        )
+
+
+class _GnssSetting(NamedTuple):
+    """A single-valued GNSS setting configured through AT+QGPSCFG."""
+    
+    config_key: str
+    at_param: str
+    value_type: type
+
+
+class _Stats:
+    """Counters for the settings handled in a configuration run."""
+    
+    __slots__ = ('checked', 'changed', 'skipped', 'failed')
+    
+    def __init__(self) -> None:
+        self.checked = 0
+        self.changed = 0
+        self.skipped = 0
+        self.failed = 0
+
 
 class SmartModemConfigurator:
     """
@@ -20,10 +161,45 @@ class SmartModemConfigurator:
     This class implements the check-set-verify pattern for modem configuration:
     1. Check current value
     2. Set if different from desired value  
-    3. Verify change was applied
+    3. Verify change was applied (optional, see verify_after_set)
     """
     
-    def __init__(self, modem: ModemCommunicator, logger: ModemLogger, config_file: str = "modem_config.yaml"):
+    # Basic settings: (config key, AT command, pattern for the query response)
+    _BASIC_SETTINGS = (
+        ('error_reporting', 'AT+CMEE', _CMEE_PATTERN),    # Error reporting mode
+        ('time_zone_update', 'AT+CTZU', _CTZU_PATTERN),   # Automatic time zone update
+    )
+    
+    # Network settings configured through AT+QOPSCFG: (config key, QOPSCFG parameter)
+    _NETWORK_SETTINGS = (
+        ('display_rssi_in_scan', 'displayrssi'),          # Display RSSI in operator scan
+        ('display_bandwidth_in_scan', 'displaybw'),       # Display bandwidth in operator scan
+    )
+    
+    # Settings that are read back after a set even when the modem acknowledged it
+    _REQUIRES_VERIFY = frozenset({
+        'AT+QGPSCFG="gnssconfig"',
+        'AT+QGPSCFG="autogps"',
+    })
+    
+    # GNSS settings, in the order they are configured
+    _GNSS_SETTINGS = (
+        _GnssSetting('output_port', 'outport', str),
+        _GnssSetting('nmea_source', 'nmeasrc', int),
+        _GnssSetting('gps_nmea_type', 'gpsnmeatype', int),
+        _GnssSetting('glonass_nmea_type', 'glonassnmeatype', int),
+        _GnssSetting('galileo_nmea_type', 'galileonmeatype', int),
+        _GnssSetting('beidou_nmea_type', 'beidounmeatype', int),
+        _GnssSetting('gsv_extended_nmea', 'gsvextnmeatype', int),
+        _GnssSetting('gnss_config', 'gnssconfig', int),
+        _GnssSetting('auto_gps', 'autogps', int),
+        _GnssSetting('agps_position_mode', 'agpsposmode', int),
+        _GnssSetting('fix_frequency', 'fixfreq', int),
+        _GnssSetting('one_pps', '1pps', int),
+    )
+    
+    def __init__(self, modem: ModemCommunicator, logger: ModemLogger, config_file: str = "modem_config.yaml",
+                 force: bool = False, verify_after_set: bool = False):
         """
         Initialize the smart configurator.
         
@@ -31,36 +207,54 @@ class SmartModemConfigurator:
             modem: ModemCommunicator instance for AT command execution
             logger: Logger instance for logging operations
             config_file: Path to YAML configuration file with desired settings
+            force: Check the GNSS settings even if this GNSS configuration was
+                already applied to the modem on a previous run
+            verify_after_set: Read a changed setting back if the modem didn't
+                acknowledge the set command with OK, or if it is in _REQUIRES_VERIFY
         """
         self.modem = modem
         self.logger = logger
         self.config_file = config_file
-        self.desired_config = self._load_configuration()
+        self.force = force
+        self.verify_after_set = verify_after_set
+        
+        # (query command, value) pairs confirmed on the modem by this instance,
+        # so repeated configure_modem() calls don't query them again
+        self._verified: Set[Tuple[str, Any]] = set()
+        
+        # Set once the modem rejects a batched query, so later calls go
+        # straight to the individual queries
+        self._batch_unsupported = False
         
         # Statistics tracking
-        self.stats = {
-            'checked': 0,
-            'changed': 0,
-            'skipped': 0,
-            'failed': 0
-        }
-    
-    def _load_configuration(self) -> Dict[str, Any]:
+        self.stats = _Stats()
+    
+    @cached_property
+    def desired_config(self) -> DesiredConfig:
+        """Desired configuration, loaded from the configuration file on first use."""
+        return self._load_configuration()
+    
+    def _load_configuration(self) -> DesiredConfig:
         """
         Load desired configuration from YAML file.
         
         Returns:
-            Dict containing the desired configuration settings
+            DesiredConfig containing the desired configuration settings
             
         Raises:
             FileNotFoundError: If configuration file doesn't exist
             yaml.YAMLError: If configuration file is invalid YAML
         """
         try:
-            with open(self.config_file, 'r') as file:
-                config = yaml.safe_load(file)
-                self.logger.log_info(f"Loaded configuration from {self.config_file}")
-                return config
+            st = os.stat(self.config_file)
+            cache_key = (os.path.abspath(self.config_file), st.st_mtime_ns, st.st_size)
+            config = _YAML_CACHE.get(cache_key)
+            if config is None:
+                config = self._parse_config_file()
+                _YAML_CACHE[cache_key] = config
+            self.logger.log_info(f"Loaded configuration from {self.config_file}")
+            # Hand out a copy so callers can't alter the cached configuration
+            return DesiredConfig.from_dict(copy.deepcopy(config))
         except FileNotFoundError:
             self.logger.log_error(f"Configuration file {self.config_file} not found")
             raise
@@ -68,6 +262,62 @@ class SmartModemConfigurator:
             self.logger.log_error(f"Invalid YAML in configuration file: {e}")
             raise
     
+    def _parse_config_file(self) -> Dict[str, Any]:
+        """
+        Parse the configuration file, reusing a JSON copy if it is unchanged.
+        
+        The parsed configuration is saved as JSON to "<config file>.<content hash>.json"
+        next to the file, so later runs with the same file contents skip YAML
+        parsing. The cache is best effort: if it can't be read or written the
+        YAML is simply parsed.
+        
+        Returns:
+            Dict containing the parsed configuration
+            
+        Raises:
+            FileNotFoundError: If configuration file doesn't exist
+            yaml.YAMLError: If configuration file is invalid YAML
+        """
+        with open(self.config_file, 'rb') as file:
+            data = file.read()
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        cache_path = f"{self.config_file}.{digest}.json"
+        
+        try:
+            with open(cache_path, 'rb') as file:
+                cached = file.read()
+            return orjson.loads(cached) if orjson is not None else json.loads(cached)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            self.logger.log_warning(f"Ignoring unreadable configuration cache {cache_path}: {e}")
+        
+        config = yaml.load(data, Loader=_SafeLoader)
+        
+        # Only cache configurations that survive a JSON round trip unchanged;
+        # YAML can also produce dates, sets and non-string keys
+        try:
+            encoded = json.dumps(config).encode('utf-8')
+            cacheable = json.loads(encoded) == config
+        except (TypeError, ValueError):
+            cacheable = False
+        if not cacheable:
+            return config
+        
+        try:
+            # Remove caches of earlier versions of the file before adding this one
+            prefix_length = len(self.config_file)
+            for stale_path in glob.glob(f"{glob.escape(self.config_file)}.*"):
+                if stale_path != cache_path and _CONFIG_CACHE_SUFFIX.fullmatch(stale_path[prefix_length:]):
+                    os.remove(stale_path)
+            with open(cache_path, 'wb') as file:
+                file.write(encoded)
+        except OSError as e:
+            # Debug only: a read-only config directory would otherwise warn on every run
+            self.logger.log_debug(f"Could not write configuration cache {cache_path}: {e}")
+        
+        return config
+    
     def configure_modem(self) -> bool:
         """
         Apply smart configuration to the modem.
@@ -82,12 +332,15 @@ class SmartModemConfigurator:
         
         success = True
         
+        # Read the current basic and network settings in one round trip
+        batch_response = self._query_batch(self._basic_network_queries())
+        
         # Configure basic settings
-        if not self._configure_basic_settings():
+        if not self._configure_basic_settings(batch_response):
             success = False
         
         # Configure network settings  
-        if not self._configure_network_settings():
+        if not self._configure_network_settings(batch_response):
             success = False
         
         # Configure GNSS settings
@@ -99,30 +352,131 @@ class SmartModemConfigurator:
         
         return success
     
-    def _configure_basic_settings(self) -> bool:
+    def _snapshot_path(self) -> Optional[str]:
+        """
+        Get the path of the last-applied GNSS snapshot for the connected modem.
+        
+        Snapshots are keyed by the modem's serial number (IMEI) so that a
+        different modem on the same port always gets its GNSS settings checked.
+        
+        Returns:
+            Optional[str]: Snapshot path, or None if the serial number couldn't be read
+        """
+        success, response = self.modem.execute_command("AT+CGSN")
+        match = _CGSN_PATTERN.search(response) if success else None
+        if not match:
+            self.logger.log_warning("Could not read modem serial number, not using a configuration snapshot")
+            return None
+        return os.path.join(os.path.expanduser(_SNAPSHOT_DIR), f"last_applied_{match.group(1)}.json")
+    
+    def _snapshot_matches(self, snapshot_path: str, config_hash: str) -> bool:
+        """
+        Check whether the GNSS configuration was already applied to the modem.
+        
+        The snapshot must have been written for the same GNSS configuration,
+        and a quick probe of the modem must agree with it, to catch a modem
+        that was reset since the snapshot was written.
+        
+        Args:
+            snapshot_path: Path of the last-applied snapshot
+            config_hash: Hash of the desired GNSS configuration
+            
+        Returns:
+            bool: True if the GNSS setting checks can be skipped
+        """
+        try:
+            with open(snapshot_path, 'r', encoding='utf-8') as file:
+                snapshot = json.load(file)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError) as e:
+            self.logger.log_warning(f"Ignoring unreadable configuration snapshot {snapshot_path}: {e}")
+            return False
+        
+        if not isinstance(snapshot, dict) or snapshot.get('config_hash') != config_hash:
+            return False
+        
+        # Sanity probe: the modem must still report the configured GNSS constellation
+        desired_gnssconfig = self.desired_config.gnss.get('gnss_config', _MISSING)
+        if desired_gnssconfig is not _MISSING:
+            success, response = self.modem.execute_command('AT+QGPSCFG="gnssconfig"')
+            raw_value = _parse_qgpscfg_values(response).get('gnssconfig') if success else None
+            if raw_value is None or _convert_qgpscfg_value(raw_value, int) != desired_gnssconfig:
+                self.logger.log_info("Modem settings differ from the configuration snapshot, checking GNSS settings")
+                return False
+        
+        return True
+    
+    def _write_snapshot(self, snapshot_path: str, config_hash: str) -> None:
+        """
+        Record that the GNSS configuration was applied to the modem.
+        
+        Args:
+            snapshot_path: Path of the last-applied snapshot
+            config_hash: Hash of the desired GNSS configuration
+        """
+        try:
+            os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+            with open(snapshot_path, 'w', encoding='utf-8') as file:
+                json.dump({'config_hash': config_hash, 'values': self.desired_config.gnss}, file, indent=2, default=str)
+        except OSError as e:
+            self.logger.log_warning(f"Could not write configuration snapshot {snapshot_path}: {e}")
+    
+    def _ensure_gnss_running(self) -> bool:
+        """
+        Power on GNSS if it is not already running.
+        
+        Returns:
+            bool: True if GNSS is running
+        """
+        success, response = self.modem.execute_command("AT+QGPS?")
+        if success and _QGPS_ON_PATTERN.search(response):
+            return True
+        
+        success, _ = self.modem.execute_command("AT+QGPS=1")
+        if not success:
+            self.logger.log_error("Failed to power on GNSS")
+            return False
+        self.logger.log_info("GNSS powered on successfully")
+        return True
+    
+    def _basic_network_queries(self) -> List[str]:
+        """Get the query commands for the configured basic and network settings."""
+        basic_config = self.desired_config.basic
+        network_config = self.desired_config.network
+        
+        queries = []
+        for config_key, at_command, _ in self._BASIC_SETTINGS:
+            desired_value = basic_config.get(config_key, _MISSING)
+            if desired_value is not _MISSING and (f"{at_command}?", desired_value) not in self._verified:
+                queries.append(f"{at_command}?")
+        for config_key, parameter in self._NETWORK_SETTINGS:
+            query_cmd = f'AT+QOPSCFG="{parameter}"'
+            desired_value = network_config.get(config_key, _MISSING)
+            if desired_value is not _MISSING and (query_cmd, desired_value) not in self._verified:
+                queries.append(query_cmd)
+        return queries
+    
+    def _configure_basic_settings(self, batch_response: Optional[str] = None) -> bool:
         """Configure basic modem settings."""
         self.logger.log_info("Configuring basic settings...")
         
-        basic_config = self.desired_config.get('basic', {})
+        basic_config = self.desired_config.basic
         success = True
         
-        # Error reporting mode
-        if 'error_reporting' in basic_config:
-            if not self._configure_cmee(basic_config['error_reporting']):
-                success = False
-        
-        # Time zone update
-        if 'time_zone_update' in basic_config:
-            if not self._configure_ctzu(basic_config['time_zone_update']):
-                success = False
+        for config_key, at_command, response_pattern in self._BASIC_SETTINGS:
+            desired_value = basic_config.get(config_key, _MISSING)
+            if desired_value is not _MISSING:
+                if not self._check_set_verify_numeric(at_command, desired_value, response_pattern, batch_response):
+                    success = False
         
         return success
     
-    def _configure_network_settings(self) -> bool:
+    def _configure_network_settings(self, batch_response: Optional[str] = None) -> bool:
         """Configure network-related settings."""
         self.logger.log_info("Configuring network settings...")
         
-        network_config = self.desired_config.get('network', {})
+        network_config = self.desired_config.network
         success = True
         
         # Clear forbidden PLMN list
@@ -130,26 +484,34 @@ class SmartModemConfigurator:
             if not self._configure_forbidden_plmn_clear():
                 success = False
         
-        # Display RSSI in scan
-        if 'display_rssi_in_scan' in network_config:
-            if not self._configure_qopscfg_displayrssi(network_config['display_rssi_in_scan']):
-                success = False
-        
-        # Display bandwidth in scan
-        if 'display_bandwidth_in_scan' in network_config:
-            if not self._configure_qopscfg_displaybw(network_config['display_bandwidth_in_scan']):
-                success = False
+        # Operator scan display settings
+        for config_key, parameter in self._NETWORK_SETTINGS:
+            desired_value = network_config.get(config_key, _MISSING)
+            if desired_value is not _MISSING:
+                if not self._check_set_verify_qopscfg(parameter, desired_value, batch_response):
+                    success = False
         
         return success
     
     def _configure_gnss_settings(self) -> bool:
         """Configure GNSS (GPS) settings."""
-        gnss_config = self.desired_config.get('gnss', {})
+        gnss_config = self.desired_config.gnss
         
         if not gnss_config.get('enabled', False):
             self.logger.log_info("GNSS is disabled in configuration, skipping GNSS setup")
             return True
         
+        config_hash = hashlib.blake2b(
+            json.dumps(gnss_config, sort_keys=True, default=str).encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+        snapshot_path = self._snapshot_path()
+        
+        if not self.force and snapshot_path and self._snapshot_matches(snapshot_path, config_hash):
+            self.logger.log_info("GNSS configuration already applied to this modem on a previous run, "
+                                 "skipping GNSS setting checks (use --force-config to check anyway)")
+            return self._ensure_gnss_running()
+        
         self.logger.log_info("Configuring GNSS settings...")
         
         # First, power off GNSS to allow configuration changes
@@ -159,31 +521,31 @@ class SmartModemConfigurator:
         
         overall_success = True
         
-        # Configure each GNSS setting
-        gnss_settings = [
-            ('output_port', 'outport', str),
-            ('nmea_source', 'nmeasrc', int),
-            ('gps_nmea_type', 'gpsnmeatype', int),
-            ('glonass_nmea_type', 'glonassnmeatype', int),
-            ('galileo_nmea_type', 'galileonmeatype', int),
-            ('beidou_nmea_type', 'beidounmeatype', int),
-            ('gsv_extended_nmea', 'gsvextnmeatype', int),
-            ('gnss_config', 'gnssconfig', int),
-            ('auto_gps', 'autogps', int),
-            ('agps_position_mode', 'agpsposmode', int),
-            ('fix_frequency', 'fixfreq', int),
-            ('one_pps', '1pps', int),
-        ]
-        
-        for config_key, at_param, value_type in gnss_settings:
-            if config_key in gnss_config:
-                desired_value = gnss_config[config_key]
-                if not self._configure_qgpscfg_setting(at_param, desired_value, value_type):
-                    overall_success = False
+        # Desired values of the configured settings, looked up once
+        desired_settings = []
+        for setting in self._GNSS_SETTINGS:
+            desired_value = gnss_config.get(setting.config_key, _MISSING)
+            if desired_value is not _MISSING:
+                desired_settings.append((setting.at_param, desired_value, setting.value_type))
+        raw_data_config = gnss_config.get('raw_data_config', _MISSING)
+        
+        # Read all current values in one round trip rather than one per setting
+        queries = []
+        for at_param, desired_value, _ in desired_settings:
+            if (f'AT+QGPSCFG="{at_param}"', desired_value) not in self._verified:
+                queries.append(f'AT+QGPSCFG="{at_param}"')
+        if raw_data_config is not _MISSING and ('AT+QGPSCFG="gnssrawdata"', raw_data_config) not in self._verified:
+            queries.append('AT+QGPSCFG="gnssrawdata"')
+        batch_response = self._query_batch(queries)
+        current_values = _parse_qgpscfg_values(batch_response) if batch_response is not None else None
+        
+        for at_param, desired_value, value_type in desired_settings:
+            if not self._configure_qgpscfg_setting(at_param, desired_value, value_type, current_values):
+                overall_success = False
         
         # Handle raw data configuration (special case with multiple parameters)
-        if 'raw_data_config' in gnss_config:
-            if not self._configure_qgpscfg_raw_data(gnss_config['raw_data_config']):
+        if raw_data_config is not _MISSING:
+            if not self._configure_qgpscfg_raw_data(raw_data_config, current_values):
                 overall_success = False
         
         # Power on GNSS after configuration
@@ -194,89 +556,150 @@ class SmartModemConfigurator:
         else:
             self.logger.log_info("GNSS powered on successfully")
         
+        if overall_success and snapshot_path:
+            self._write_snapshot(snapshot_path, config_hash)
+        
         return overall_success
     
-    def _configure_cmee(self, desired_value: int) -> bool:
-        """Configure error reporting mode (AT+CMEE)."""
-        return self._check_set_verify_numeric("AT+CMEE", desired_value, r'\+CMEE:\s*(\d+)')
-    
-    def _configure_ctzu(self, desired_value: int) -> bool:
-        """Configure automatic time zone update (AT+CTZU)."""
-        return self._check_set_verify_numeric("AT+CTZU", desired_value, r'\+CTZU:\s*(\d+)')
-    
     def _configure_forbidden_plmn_clear(self) -> bool:
         """Clear forbidden PLMN list if it's not already empty."""
-        self.stats['checked'] += 1
+        self.stats.checked += 1
         
         # Check if FPLMN list has entries
         success, response = self.modem.execute_command('AT+QFPLMNCFG="list"')
         if not success:
             self.logger.log_error("Failed to check FPLMN list")
-            self.stats['failed'] += 1
+            self.stats.failed += 1
             return False
         
         # If response contains PLMN entries (not just OK), clear the list
         if '+QFPLMNCFG:' in response:
-            self.logger.log_info("FPLMN list contains entries, clearing...")
             success, response = self.modem.execute_command('AT+QFPLMNCFG="Delete","all"')
             if success:
-                self.logger.log_info("FPLMN list cleared successfully")
-                self.stats['changed'] += 1
+                self.logger.log_info("FPLMN list contained entries, cleared successfully")
+                self.stats.changed += 1
                 return True
             else:
                 self.logger.log_error("Failed to clear FPLMN list")
-                self.stats['failed'] += 1
+                self.stats.failed += 1
                 return False
         else:
             self.logger.log_info("FPLMN list is already empty, skipping clear operation")
-            self.stats['skipped'] += 1
+            self.stats.skipped += 1
             return True
 
-    def _configure_qopscfg_displayrssi(self, desired_value: int) -> bool:
-        """Configure RSSI display in operator scan."""
-        return self._check_set_verify_qopscfg("displayrssi", desired_value)
+    def _query_batch(self, queries: List[str]) -> Optional[str]:
+        """
+        Run several query commands with a single AT command line.
         
-    def _configure_qopscfg_displaybw(self, desired_value: int) -> bool:
-        """Configure bandwidth display in operator scan."""
-        return self._check_set_verify_qopscfg("displaybw", desired_value)
+        The queries are joined with the ";" separator so the modem answers all
+        of them in one response. After the modem rejects one batch, this
+        instance doesn't send any more.
         
-    def _configure_qgpscfg_setting(self, setting: str, desired_value: Any, value_type: type) -> bool:
-        """Configure a QGPSCFG setting."""
-        self.stats['checked'] += 1
+        Args:
+            queries: Query commands, each starting with "AT" (e.g., 'AT+CMEE?')
+            
+        Returns:
+            Optional[str]: Combined query response, or None if the batched query failed
+        """
+        if not queries or self._batch_unsupported:
+            return None
         
-        # Query current value
-        query_cmd = f'AT+QGPSCFG="{setting}"'
-        success, response = self.modem.execute_command(query_cmd)
+        query_cmd = "AT" + ";".join(query[2:] for query in queries)
+        # No retries: a rejected batch falls back to the individual queries
+        success, response = self.modem.execute_command(query_cmd, retries=0)
         if not success:
-            self.logger.log_error(f"Failed to query QGPSCFG {setting}")
-            self.stats['failed'] += 1
+            self.logger.log_warning("Batched query failed, querying settings individually")
+            self._batch_unsupported = True
+            return None
+        return response
+    
+    def _verify_after_set(self, query_cmd: str, desired_value: Any, set_response: str,
+                          read_value: Callable[[str], Any]) -> bool:
+        """
+        Read a setting back after changing it, when verification is enabled.
+        
+        An OK acknowledgement means the modem applied the set command, so the
+        extra query is only sent without one or for settings in _REQUIRES_VERIFY.
+        
+        Args:
+            query_cmd: Query command for the setting
+            desired_value: Value the setting was changed to
+            set_response: Response to the set command
+            read_value: Function extracting the current value from a query response
+            
+        Returns:
+            bool: True if the change is confirmed or didn't need confirming
+        """
+        if not self.verify_after_set:
+            return True
+        if 'OK' in set_response and query_cmd not in self._REQUIRES_VERIFY:
+            return True
+        
+        success, response = self.modem.execute_command(query_cmd)
+        if success and read_value(response) == desired_value:
+            return True
+        self.logger.log_error(f"{query_cmd} did not read back as {desired_value} after it was set")
+        return False
+    
+    def _skip_verified(self, query_cmd: str, desired_value: Any) -> bool:
+        """
+        Skip a setting already confirmed on the modem by an earlier configure_modem() call.
+        
+        Args:
+            query_cmd: Query command for the setting
+            desired_value: Desired value for the setting
+            
+        Returns:
+            bool: True if the setting was counted as skipped
+        """
+        if (query_cmd, desired_value) not in self._verified:
             return False
+        self.logger.log_info(f"{query_cmd} already confirmed as {desired_value}, skipping")
+        self.stats.skipped += 1
+        return True
+    
+    def _configure_qgpscfg_setting(self, setting: str, desired_value: Any, value_type: type,
+                                   current_values: Optional[Dict[str, str]] = None) -> bool:
+        """
+        Configure a QGPSCFG setting.
         
-        # Parse current value
-        if value_type == str:
-            # Modified pattern to handle both quoted and unquoted string values
-            # This will match: +QGPSCFG: "setting","value" or +QGPSCFG: "setting",value
-            pattern = rf'\+QGPSCFG:\s*"{re.escape(setting)}",\s*(?:"([^"]*)"|([^,\s\r\n]*))'
-        else:
-            pattern = rf'\+QGPSCFG:\s*"{re.escape(setting)}",\s*(\d+)'
+        Args:
+            setting: QGPSCFG setting name (e.g., "outport")
+            desired_value: Desired value for the setting
+            value_type: Type of the value (str or int)
+            current_values: Raw values parsed from a batched QGPSCFG query; the
+                setting is queried on its own if this is None or doesn't contain it
+            
+        Returns:
+            bool: True if setting was successful or already correct
+        """
+        self.stats.checked += 1
+        query_cmd = f'AT+QGPSCFG="{setting}"'
+        if self._skip_verified(query_cmd, desired_value):
+            return True
         
-        match = re.search(pattern, response)
-        if not match:
+        raw_value = current_values.get(setting) if current_values is not None else None
+        if raw_value is None:
+            # Query current value
+            success, response = self.modem.execute_command(query_cmd)
+            if not success:
+                self.logger.log_error(f"Failed to query QGPSCFG {setting}")
+                self.stats.failed += 1
+                return False
+            raw_value = _parse_qgpscfg_values(response).get(setting)
+        
+        # Parse current value
+        current_value = _convert_qgpscfg_value(raw_value, value_type) if raw_value is not None else None
+        if current_value is None:
             self.logger.log_warning(f"Could not parse current value for QGPSCFG {setting}")
             # Proceed with setting anyway
-            current_value = None
-        else:
-            # For string values, use the first non-None group (either quoted or unquoted match)
-            if value_type == str:
-                current_value = match.group(1) if match.group(1) is not None else match.group(2)
-            else:
-                current_value = match.group(1)
-                current_value = int(current_value)
         
         # Check if change is needed
         if current_value == desired_value:
             self.logger.log_info(f"QGPSCFG {setting} already set to {desired_value}, skipping")
-            self.stats['skipped'] += 1
+            self.stats.skipped += 1
+            self._verified.add((query_cmd, desired_value))
             return True
         
         # Set new value
@@ -285,177 +708,183 @@ class SmartModemConfigurator:
         else:
             set_cmd = f'AT+QGPSCFG="{setting}",{desired_value}'
         
-        self.logger.log_info(f"Changing QGPSCFG {setting} from {current_value} to {desired_value}")
         success, response = self.modem.execute_command(set_cmd)
-        if success:
-            self.logger.log_info(f"QGPSCFG {setting} configured successfully")
-            self.stats['changed'] += 1
+        if success and self._verify_after_set(
+                query_cmd, desired_value, response,
+                lambda reply: _convert_qgpscfg_value(_parse_qgpscfg_values(reply).get(setting, ''), value_type)):
+            self.logger.log_info(f"Changed QGPSCFG {setting} from {current_value} to {desired_value}")
+            self.stats.changed += 1
+            self._verified.add((query_cmd, desired_value))
             return True
         else:
-            self.logger.log_error(f"Failed to configure QGPSCFG {setting}: {response}")
-            self.stats['failed'] += 1
+            self.logger.log_error(f"Failed to change QGPSCFG {setting} from {current_value} to {desired_value}: {response}")
+            self.stats.failed += 1
             return False
     
-    def _configure_qgpscfg_raw_data(self, config_value: str) -> bool:
+    def _configure_qgpscfg_raw_data(self, config_value: str,
+                                    current_values: Optional[Dict[str, str]] = None) -> bool:
         """Configure GNSS raw data output (special case with multiple parameters)."""
-        self.stats['checked'] += 1
-        
-        # Query current value
-        success, response = self.modem.execute_command('AT+QGPSCFG="gnssrawdata"')
-        if not success:
-            self.logger.log_error("Failed to query QGPSCFG gnssrawdata")
-            self.stats['failed'] += 1
-            return False
-        
-        # Parse current value (format: +QGPSCFG: "gnssrawdata",31,0)
-        # More flexible pattern to handle various response formats
-        pattern = r'\+QGPSCFG:\s*"gnssrawdata",\s*(.+)'
-        match = re.search(pattern, response)
-        current_value = match.group(1).strip() if match else None
+        self.stats.checked += 1
+        query_cmd = 'AT+QGPSCFG="gnssrawdata"'
+        if self._skip_verified(query_cmd, config_value):
+            return True
         
-        # Strip any trailing content after the values (like OK)
-        if current_value and '\n' in current_value:
-            current_value = current_value.split('\n')[0].strip()
+        # Current value (format: +QGPSCFG: "gnssrawdata",31,0) is the whole raw value text
+        current_value = current_values.get('gnssrawdata') if current_values is not None else None
+        if not current_value:
+            # Query current value
+            success, response = self.modem.execute_command(query_cmd)
+            if not success:
+                self.logger.log_error("Failed to query QGPSCFG gnssrawdata")
+                self.stats.failed += 1
+                return False
+            current_value = _parse_qgpscfg_values(response).get('gnssrawdata') or None
         
         # Check if change is needed
         if current_value == config_value:
             self.logger.log_info(f"QGPSCFG gnssrawdata already set to {config_value}, skipping")
-            self.stats['skipped'] += 1
+            self.stats.skipped += 1
+            self._verified.add((query_cmd, config_value))
             return True
         
         # Set new value
         set_cmd = f'AT+QGPSCFG="gnssrawdata",{config_value}'
-        self.logger.log_info(f"Changing QGPSCFG gnssrawdata from {current_value} to {config_value}")
         success, response = self.modem.execute_command(set_cmd)
-        if success:
-            self.logger.log_info("QGPSCFG gnssrawdata configured successfully")
-            self.stats['changed'] += 1
+        if success and self._verify_after_set(
+                query_cmd, config_value, response,
+                lambda reply: _parse_qgpscfg_values(reply).get('gnssrawdata')):
+            self.logger.log_info(f"Changed QGPSCFG gnssrawdata from {current_value} to {config_value}")
+            self.stats.changed += 1
+            self._verified.add((query_cmd, config_value))
             return True
         else:
-            self.logger.log_error(f"Failed to configure QGPSCFG gnssrawdata: {response}")
-            self.stats['failed'] += 1
+            self.logger.log_error(f"Failed to change QGPSCFG gnssrawdata from {current_value} to {config_value}: {response}")
+            self.stats.failed += 1
             return False
     
-    def _check_set_verify_numeric(self, at_command: str, desired_value: int, response_pattern: str) -> bool:
+    def _check_set_verify_numeric(self, at_command: str, desired_value: int, response_pattern: Pattern[str],
+                                  batch_response: Optional[str] = None) -> bool:
         """
         Generic method for check-set-verify pattern with numeric values.
 
         Args:
             at_command: Base AT command (e.g., "AT+CMEE")
             desired_value: Desired numeric value
-            response_pattern: Regex pattern to extract current value from query response
+            response_pattern: Compiled pattern to extract current value from query response
+            batch_response: Response of a batched query; the setting is queried
+                on its own if this is None or doesn't contain it
             
         Returns:
             bool: True if setting was successful or already correct
         """
-        self.stats['checked'] += 1
-        
-        # Query current value
+        self.stats.checked += 1
         query_cmd = f"{at_command}?"
-        success, response = self.modem.execute_command(query_cmd)
-        if not success:
-            self.logger.log_error(f"Failed to query {at_command}")
-            self.stats['failed'] += 1
-            return False
+        if self._skip_verified(query_cmd, desired_value):
+            return True
         
-        # Parse current value
-        match = re.search(response_pattern, response)
-        if not match:
+        current_value = _search_int(response_pattern, batch_response) if batch_response is not None else None
+        if current_value is None:
+            # Query current value
+            success, response = self.modem.execute_command(query_cmd)
+            if not success:
+                self.logger.log_error(f"Failed to query {at_command}")
+                self.stats.failed += 1
+                return False
+            
+            # Parse current value
+            current_value = _search_int(response_pattern, response)
+        if current_value is None:
             self.logger.log_warning(f"Could not parse current value for {at_command}")
             # Proceed with setting anyway
-            current_value = None
-        else:
-            try:
-                current_value = int(match.group(1))
-            except (ValueError, TypeError):
-                self.logger.log_warning(f"Failed to convert {at_command} value to integer: {match.group(1)}")
-                current_value = None
         
         # Check if change is needed
         if current_value == desired_value:
             self.logger.log_info(f"{at_command} already set to {desired_value}, skipping")
-            self.stats['skipped'] += 1
+            self.stats.skipped += 1
+            self._verified.add((query_cmd, desired_value))
             return True
         
         # Set new value
         set_cmd = f"{at_command}={desired_value}"
-        self.logger.log_info(f"Changing {at_command} from {current_value} to {desired_value}")
         success, response = self.modem.execute_command(set_cmd)
-        if success:
-            self.logger.log_info(f"{at_command} configured successfully")
-            self.stats['changed'] += 1
+        if success and self._verify_after_set(query_cmd, desired_value, response,
+                                              partial(_search_int, response_pattern)):
+            self.logger.log_info(f"Changed {at_command} from {current_value} to {desired_value}")
+            self.stats.changed += 1
+            self._verified.add((query_cmd, desired_value))
             return True
         else:
-            self.logger.log_error(f"Failed to configure {at_command}: {response}")
-            self.stats['failed'] += 1
+            self.logger.log_error(f"Failed to change {at_command} from {current_value} to {desired_value}: {response}")
+            self.stats.failed += 1
             return False
     
-    def _check_set_verify_qopscfg(self, parameter: str, desired_value: int) -> bool:
+    def _check_set_verify_qopscfg(self, parameter: str, desired_value: int,
+                                  batch_response: Optional[str] = None) -> bool:
         """Check-set-verify pattern for QOPSCFG parameters."""
-        self.stats['checked'] += 1
-        
-        # Query current value
+        self.stats.checked += 1
         query_cmd = f'AT+QOPSCFG="{parameter}"'
-        success, response = self.modem.execute_command(query_cmd)
-        if not success:
-            self.logger.log_error(f"Failed to query QOPSCFG {parameter}")
-            self.stats['failed'] += 1
-            return False
+        if self._skip_verified(query_cmd, desired_value):
+            return True
         
-        # Parse current value - handle both quoted and unquoted numeric values
-        pattern = rf'\+QOPSCFG:\s*"{re.escape(parameter)}",\s*(\d+)'
-        match = re.search(pattern, response)
-        if not match:
+        pattern = _qopscfg_pattern(parameter)
+        current_value = _search_int(pattern, batch_response) if batch_response is not None else None
+        if current_value is None:
+            # Query current value
+            success, response = self.modem.execute_command(query_cmd)
+            if not success:
+                self.logger.log_error(f"Failed to query QOPSCFG {parameter}")
+                self.stats.failed += 1
+                return False
+            
+            # Parse current value
+            current_value = _search_int(pattern, response)
+        if current_value is None:
             self.logger.log_warning(f"Could not parse current value for QOPSCFG {parameter}")
             # Proceed with setting anyway
-            current_value = None
-        else:
-            try:
-                current_value = int(match.group(1))
-            except (ValueError, TypeError):
-                self.logger.log_warning(f"Failed to convert QOPSCFG {parameter} value to integer: {match.group(1)}")
-                current_value = None
-          # Check if change is needed
+        
+        # Check if change is needed
         if current_value == desired_value:
             self.logger.log_info(f"QOPSCFG {parameter} already set to {desired_value}, skipping")
-            self.stats['skipped'] += 1
+            self.stats.skipped += 1
+            self._verified.add((query_cmd, desired_value))
             return True
         
         # Set new value
         set_cmd = f'AT+QOPSCFG="{parameter}",{desired_value}'
-        self.logger.log_info(f"Changing QOPSCFG {parameter} from {current_value} to {desired_value}")
         success, response = self.modem.execute_command(set_cmd)
-        if success:
-            self.logger.log_info(f"QOPSCFG {parameter} configured successfully")
-            self.stats['changed'] += 1
+        if success and self._verify_after_set(query_cmd, desired_value, response, partial(_search_int, pattern)):
+            self.logger.log_info(f"Changed QOPSCFG {parameter} from {current_value} to {desired_value}")
+            self.stats.changed += 1
+            self._verified.add((query_cmd, desired_value))
             return True
         else:
-            self.logger.log_error(f"Failed to configure QOPSCFG {parameter}: {response}")
-            self.stats['failed'] += 1
+            self.logger.log_error(f"Failed to change QOPSCFG {parameter} from {current_value} to {desired_value}: {response}")
+            self.stats.failed += 1
             return False
     
     def _print_configuration_summary(self) -> None:
         """Print summary of configuration operations."""
         self.logger.log_info("-" * 60)
         self.logger.log_info("Smart Configuration Summary:")
-        self.logger.log_info(f"  Settings checked: {self.stats['checked']}")
-        self.logger.log_info(f"  Settings changed: {self.stats['changed']}")
-        self.logger.log_info(f"  Settings skipped (already correct): {self.stats['skipped']}")
-        self.logger.log_info(f"  Settings failed: {self.stats['failed']}")
-        
-        if self.stats['changed'] > 0:
-            self.logger.log_info(f"[OK] Applied {self.stats['changed']} configuration changes")
-        if self.stats['skipped'] > 0:
-            self.logger.log_info(f"[OK] Skipped {self.stats['skipped']} settings (already correct)")
-        if self.stats['failed'] > 0:
-            self.logger.log_warning(f"[!] {self.stats['failed']} settings failed to configure")
-        
-        efficiency = (self.stats['skipped'] / self.stats['checked'] * 100) if self.stats['checked'] > 0 else 0
+        self.logger.log_info(f"  Settings checked: {self.stats.checked}")
+        self.logger.log_info(f"  Settings changed: {self.stats.changed}")
+        self.logger.log_info(f"  Settings skipped (already correct): {self.stats.skipped}")
+        self.logger.log_info(f"  Settings failed: {self.stats.failed}")
+        
+        if self.stats.changed > 0:
+            self.logger.log_info(f"[OK] Applied {self.stats.changed} configuration changes")
+        if self.stats.skipped > 0:
+            self.logger.log_info(f"[OK] Skipped {self.stats.skipped} settings (already correct)")
+        if self.stats.failed > 0:
+            self.logger.log_warning(f"[!] {self.stats.failed} settings failed to configure")
+        
+        efficiency = (self.stats.skipped / self.stats.checked * 100) if self.stats.checked > 0 else 0
         self.logger.log_info(f"Flash wear reduction: {efficiency:.1f}% of settings skipped")
         self.logger.log_info("-" * 60)
 
 
-def apply_smart_configuration(modem: ModemCommunicator, config_file: str, logger: ModemLogger) -> bool:
+def apply_smart_configuration(modem: ModemCommunicator, config_file: str, logger: ModemLogger,
+                              force: bool = False) -> bool:
     """
     Convenience function to apply smart configuration to a modem.
     
@@ -463,12 +892,13 @@ def apply_smart_configuration(modem: ModemCommunicator, config_file: str, logger
         modem: ModemCommunicator instance
         logger: Logger instance
         config_file: Path to YAML configuration file
+        force: Check the GNSS settings even if they were already applied
         
     Returns:
         bool: True if configuration was successful
     """
     try:
-        configurator = SmartModemConfigurator(modem, logger, config_file)
+        configurator = SmartModemConfigurator(modem, logger, config_file, force=force)
         return configurator.configure_modem()
     except Exception as e:
         logger.log_error(f"Smart configuration failed: {e}")